@@ -45,6 +45,11 @@ class Settings(BaseSettings):
 
     # Database (PostgreSQL) - NO DEFAULT for production safety
     DATABASE_URL: str = ""
+    # Connection pool / driver tuning (PostgreSQL only; ignored for SQLite)
+    DB_POOL_SIZE: int = 32
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 1024  # asyncpg prepared statements per connection
 
     # Graph Database (Neo4j)
     NEO4J_URI: str = "bolt://localhost:7687"
@@ -108,8 +113,12 @@ class Settings(BaseSettings):
     QUERY_TIMEOUT_SECONDS: int = 30
     MAX_QUERY_LENGTH: int = 500
 
+    # Ingestion: optional fastText language ID model (lid.176.ftz)
+    FASTTEXT_LID_MODEL: str = ""
+
     # Health monitoring settings
     HEALTH_SCAN_INTERVAL_HOURS: int = 48
+    HEALTH_SCAN_CONCURRENCY: int = 8  # Max organizations scanned at once
 
     # File storage
     UPLOAD_DIR: str = "./uploads"
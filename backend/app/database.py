@@ -18,11 +18,19 @@ engine_kwargs = {
 # Only add pool settings for non-SQLite databases
 if not settings.DATABASE_URL.startswith("sqlite"):
     engine_kwargs.update({
-        "pool_pre_ping": True,
-        "pool_size": 10,
-        "max_overflow": 20
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW
     })
 
+# Keep prepared statements hot on asyncpg: both asyncpg's own cache and
+# SQLAlchemy's adapter cache default to 100 entries per connection
+if "+asyncpg" in settings.DATABASE_URL:
+    engine_kwargs["connect_args"] = {
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    }
+
 engine = create_async_engine(settings.DATABASE_URL, **engine_kwargs)
 
 # Create session factory
@@ -163,6 +163,25 @@ def get_citation_service_dependency():
     return _citation_service
 
 
+def get_org_vector_data_dependency(
+    user: User = Depends(_get_current_user_orm)
+) -> dict:
+    """
+    Get the current user's organization vector data for FastAPI routes.
+
+    FastAPI resolves a dependency once per request, so every consumer in
+    the same request shares one loaded copy.
+
+    Args:
+        user: Authenticated user
+
+    Returns:
+        Organization vector data (see vector_service.load_org_data)
+    """
+    from app.services.vector_service import load_org_data
+    return load_org_data(str(user.organization_id))
+
+
 def get_analytics_service_dependency(db=Depends(get_db)):
     """
     Get analytics service dependency for FastAPI routes.
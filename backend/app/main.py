@@ -86,6 +86,7 @@ from app.services.digest_scheduler import start_digest_scheduler, stop_digest_sc
 from app.services.ingestion.pipeline import IngestionPipeline
 from app.workers.health_worker import start_health_worker, stop_health_worker
 from app.workers.inbox_poller import start_inbox_poller, stop_inbox_poller
+from app.workers.recharge_worker import start_recharge_worker, stop_recharge_worker
 from app.workers.sync_worker import init_sync_worker, sync_worker
 
 logger = logging.getLogger(__name__)
@@ -132,6 +133,10 @@ async def lifespan(app: FastAPI):
         # embedding keys — needs only Gmail OAuth credentials).
         await start_inbox_poller()
         logger.info("Inbox poller started")
+
+        # Start recharge worker (wallet auto-recharge off the request path)
+        await start_recharge_worker()
+        logger.info("Recharge worker started")
     except Exception as e:
         logger.warning(f"Failed to start background workers: {e}")
         # Continue without workers - app still functional
@@ -152,6 +157,10 @@ async def lifespan(app: FastAPI):
         await stop_inbox_poller()
         logger.info("Inbox poller stopped")
 
+        # Stop recharge worker
+        await stop_recharge_worker()
+        logger.info("Recharge worker stopped")
+
         # Stop sync worker
         if sync_worker:
             await sync_worker.stop()
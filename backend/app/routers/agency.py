@@ -7,6 +7,7 @@ GoHighLevel-style agency management:
 - Branding management
 """
 
+import dataclasses
 import logging
 from decimal import Decimal
 from uuid import uuid4
@@ -92,6 +93,19 @@ class RebillingConfig(BaseModel):
     rebilling_enabled: bool
 
 
+class WalletSummaryResponse(BaseModel):
+    """Wallet status summary"""
+    balance: Decimal
+    auto_recharge_enabled: bool
+    recharge_amount: Decimal
+    recharge_threshold: Decimal
+    stripe_connected: bool
+
+    @classmethod
+    def from_summary(cls, summary: WalletSummary) -> "WalletSummaryResponse":
+        return cls.model_validate(dataclasses.asdict(summary))
+
+
 class WalletRechargeRequest(BaseModel):
     """Wallet recharge request"""
     amount: Decimal = Field(..., ge=10)
@@ -333,7 +347,7 @@ async def update_sub_account_features(
 # Wallet Endpoints
 # =============================================================================
 
-@router.get("/agency/wallet", response_model=WalletSummary)
+@router.get("/agency/wallet", response_model=WalletSummaryResponse)
 async def get_agency_wallet(
     organization_id: str = Query(..., description="Organization ID"),
     session: AsyncSession = Depends(get_db),
@@ -344,10 +358,11 @@ async def get_agency_wallet(
         raise HTTPException(status_code=404, detail="Organization not found")
 
     wallet_service = WalletService(session)
-    return await wallet_service.get_wallet_summary(organization_id)
+    summary = await wallet_service.get_wallet_summary(organization_id)
+    return WalletSummaryResponse.from_summary(summary)
 
 
-@router.post("/agency/wallet/recharge", response_model=WalletSummary)
+@router.post("/agency/wallet/recharge", response_model=WalletSummaryResponse)
 async def recharge_wallet(
     data: WalletRechargeRequest,
     organization_id: str = Query(..., description="Organization ID"),
@@ -373,10 +388,11 @@ async def recharge_wallet(
         "recharge"
     )
 
-    return await wallet_service.get_wallet_summary(organization_id)
+    summary = await wallet_service.get_wallet_summary(organization_id)
+    return WalletSummaryResponse.from_summary(summary)
 
 
-@router.put("/agency/wallet/auto-recharge", response_model=WalletSummary)
+@router.put("/agency/wallet/auto-recharge", response_model=WalletSummaryResponse)
 async def configure_auto_recharge(
     config: AutoRechargeConfig,
     organization_id: str = Query(..., description="Organization ID"),
@@ -388,12 +404,13 @@ async def configure_auto_recharge(
         raise HTTPException(status_code=404, detail="Organization not found")
 
     wallet_service = WalletService(session)
-    return await wallet_service.configure_auto_recharge(
+    summary = await wallet_service.configure_auto_recharge(
         organization_id,
         enabled=config.enabled,
         recharge_amount=config.recharge_amount,
         recharge_threshold=config.recharge_threshold,
     )
+    return WalletSummaryResponse.from_summary(summary)
 
 
 # =============================================================================
@@ -12,6 +12,7 @@ from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, Upload
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
+from app.dependencies import get_org_vector_data_dependency
 from app.models import User
 from app.services import document_service, vector_service
 from app.services.auth_service import get_current_user
@@ -266,7 +267,8 @@ async def index_document(
 async def search_documents(
     query: str = Form(...),
     limit: int = Form(10),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    org_data: dict = Depends(get_org_vector_data_dependency)
 ):
     """
     Semantic search across indexed documents.
@@ -276,7 +278,8 @@ async def search_documents(
         results = await vector_service.search_similar(
             query=query,
             organization_id=str(current_user.organization_id),
-            limit=limit
+            limit=limit,
+            org_data=org_data
         )
 
         return {
@@ -292,14 +295,16 @@ async def search_documents(
 
 @router.get("/index/stats")
 async def get_index_stats(
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    org_data: dict = Depends(get_org_vector_data_dependency)
 ):
     """
     Get statistics about the vector index.
     """
     try:
         stats = await vector_service.get_index_stats(
-            organization_id=str(current_user.organization_id)
+            organization_id=str(current_user.organization_id),
+            org_data=org_data
         )
         return stats
 
@@ -8,6 +8,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query as FastAPIQuery, st
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
+from app.dependencies import get_org_vector_data_dependency
 from app.models import User
 from app.schemas.query import (
     PerformanceTrend,
@@ -30,7 +31,8 @@ router = APIRouter()
 async def process_query(
     request: QueryRequest,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    org_data: dict = Depends(get_org_vector_data_dependency)
 ):
     """
     Process a knowledge synthesis query through complete RAG pipeline
@@ -77,7 +79,8 @@ async def process_query(
                     query=sub_query,
                     organization_id=request.organization_id,
                     max_sources=max(3, request.max_sources // 2),  # Fewer sources per sub-query
-                    use_cache=request.use_cache
+                    use_cache=request.use_cache,
+                    org_data=org_data
                 )
                 all_sources.extend(sub_result.get("sources", []))
                 if sub_result.get("answer"):
@@ -98,7 +101,8 @@ async def process_query(
                 query=request.query,
                 organization_id=request.organization_id,
                 max_sources=request.max_sources,
-                use_cache=request.use_cache
+                use_cache=request.use_cache,
+                org_data=org_data
             )
             result["research_mode"] = research_mode_used
 
@@ -13,6 +13,9 @@ try:
 except Exception:
     tokenizer = tiktoken.get_encoding("cl100k_base")
 
+# Appended to excerpts cut down to fit the token budget
+TRUNCATION_SUFFIX = "... [truncated]"
+
 
 class ContextBuilder:
     """Builds optimized context for Claude synthesis"""
@@ -214,38 +217,32 @@ Content:
         if available_for_content < 50:  # Minimum meaningful content
             return ""
 
-        # Truncate excerpt to fit
+        # Truncate excerpt to fit. Candidates are measured as the full
+        # rendered source (suffix included), since tokens don't add up
+        # exactly across the metadata/content boundary.
         excerpt = source.excerpt
-        excerpt_tokens = self.count_tokens(excerpt)
 
-        if excerpt_tokens <= available_for_content:
-            truncated_excerpt = excerpt
-        else:
-            # Binary search for optimal length
-            chars = len(excerpt)
-            left, right = 0, chars
+        def render(content: str) -> str:
+            return metadata_template.replace("[CONTENT]", content)
 
-            while left < right:
-                mid = (left + right + 1) // 2
-                candidate = excerpt[:mid] + "..."
+        if self.count_tokens(render(excerpt)) <= max_tokens:
+            return render(excerpt)
 
-                if self.count_tokens(candidate) <= available_for_content:
-                    left = mid
-                else:
-                    right = mid - 1
+        # Binary search for optimal length
+        chars = len(excerpt)
+        left, right = 0, chars
 
-            truncated_excerpt = excerpt[:left] + "... [truncated]"
+        while left < right:
+            mid = (left + right + 1) // 2
+            candidate = render(excerpt[:mid] + TRUNCATION_SUFFIX)
 
-        # Build truncated source
-        return f"""[Source {index}]
-Document ID: {source.document_id}
-Title: {source.title}
-URL: {source.url or 'N/A'}
-Relevance Score: {source.relevance_score:.3f}
+            if self.count_tokens(candidate) <= max_tokens:
+                left = mid
+            else:
+                right = mid - 1
 
-Content:
-{truncated_excerpt}
----"""
+        # Build truncated source
+        return render(excerpt[:left] + TRUNCATION_SUFFIX)
 
     def build_user_prompt(self, query: str, context: str, has_email_sources: bool = False) -> str:
         """
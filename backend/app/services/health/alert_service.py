@@ -2,6 +2,7 @@
 """Manage health alerts and notifications."""
 
 import logging
+from collections import Counter
 from datetime import datetime
 from uuid import uuid4
 
@@ -342,3 +343,63 @@ class AlertService:
             logger.info(f"Cleared {cleared} old resolved alerts for org {org_id}")
 
         return cleared
+
+    async def auto_resolve_stale_alerts_bulk(self, cutoff: datetime) -> Counter[str]:
+        """
+        Auto-resolve active alerts of every organization not updated since cutoff.
+
+        Single-pass equivalent of auto_resolve_stale_alerts for all orgs.
+
+        Args:
+            cutoff: Alerts last updated before this time are resolved
+
+        Returns:
+            Number of alerts auto-resolved per organization ID
+        """
+        days = (datetime.utcnow() - cutoff).days
+        stale = [
+            alert for alert in self.alerts.values()
+            if alert["status"] == "active"
+            and datetime.fromisoformat(alert["updated_at"]) < cutoff
+        ]
+
+        resolved: Counter[str] = Counter()
+        for alert in stale:
+            await self.resolve_alert(alert["id"], f"Auto-resolved: No activity for {days} days")
+            resolved[alert["org_id"]] += 1
+
+        return resolved
+
+    async def clear_resolved_alerts_bulk(self, cutoff: datetime) -> Counter[str]:
+        """
+        Clear resolved or dismissed alerts of every organization resolved before cutoff.
+
+        Single-pass equivalent of clear_resolved_alerts for all orgs.
+
+        Args:
+            cutoff: Alerts resolved before this time are cleared
+
+        Returns:
+            Number of alerts cleared per organization ID
+        """
+        expired = [
+            alert for alert in self.alerts.values()
+            if alert["status"] in ["resolved", "dismissed"]
+            and alert.get("resolved_at")
+            and datetime.fromisoformat(alert["resolved_at"]) < cutoff
+        ]
+
+        cleared: Counter[str] = Counter()
+        timestamp = datetime.utcnow().isoformat()
+        for alert in expired:
+            # Move to history and remove from active alerts
+            self.alert_history.append({
+                "alert_id": alert["id"],
+                "action": "cleared",
+                "alert_data": alert,
+                "timestamp": timestamp
+            })
+            del self.alerts[alert["id"]]
+            cleared[alert["org_id"]] += 1
+
+        return cleared
@@ -1,8 +1,14 @@
 """Calculate organization knowledge health score."""
 
 import logging
+import time
 from datetime import datetime
 
+from sqlalchemy import case, extract, func, select
+
+from app.database import async_session_maker
+from app.models import Document, Query
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,6 +25,45 @@ class HealthScorer:
             "coverage": 0.15           # Gap analysis
         }
 
+    async def get_org_stats(self, org_id: str) -> dict:
+        """
+        Get document and query statistics used as scoring inputs.
+
+        Args:
+            org_id: Organization ID
+
+        Returns:
+            Dict with total_docs, total_queries, successful_queries and
+            avg_doc_age_days
+        """
+        async with async_session_maker() as db:
+            # Mean age is now minus the mean creation time, so one
+            # aggregate over epoch seconds covers it
+            total_docs, avg_created_epoch = (await db.execute(
+                select(
+                    func.count(),
+                    func.avg(extract("epoch", Document.created_at)),
+                ).where(Document.organization_id == org_id)
+            )).one()
+            total_queries, successful_queries = (await db.execute(
+                select(
+                    func.count(),
+                    func.coalesce(func.sum(case((Query.sources_cited > 0, 1), else_=0)), 0),
+                ).where(Query.organization_id == org_id)
+            )).one()
+
+        avg_doc_age_days = (
+            (time.time() - float(avg_created_epoch)) / 86400
+            if total_docs else 0.0
+        )
+
+        return {
+            "total_docs": total_docs,
+            "total_queries": total_queries,
+            "successful_queries": successful_queries,
+            "avg_doc_age_days": avg_doc_age_days,
+        }
+
     async def calculate_health_score(
         self,
         org_id: str,
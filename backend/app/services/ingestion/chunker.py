@@ -11,7 +11,7 @@ Splits documents into semantic chunks for embedding:
 import logging
 from typing import Any
 
-from app.utils.text_processing import text_processor
+from app.utils.text_processing import approx_count_tokens, text_processor
 
 logger = logging.getLogger(__name__)
 
@@ -100,8 +100,9 @@ class DocumentChunker:
         current_tokens = 0
         chunk_index = 0
 
-        for para in paragraphs:
-            para_tokens = text_processor.count_tokens(para)
+        para_token_counts = text_processor.count_tokens_batch(paragraphs)
+
+        for para, para_tokens in zip(paragraphs, para_token_counts):
 
             # If paragraph is too large, split it further
             if para_tokens > self.max_tokens:
@@ -182,9 +183,9 @@ class DocumentChunker:
         current_tokens = 0
         chunk_index = start_index
 
-        for sentence in sentences:
-            sentence_tokens = text_processor.count_tokens(sentence)
+        sentence_token_counts = text_processor.count_tokens_batch(sentences)
 
+        for sentence, sentence_tokens in zip(sentences, sentence_token_counts):
             # If single sentence exceeds max, split by tokens
             if sentence_tokens > self.max_tokens:
                 # Flush current chunk
@@ -249,13 +250,18 @@ class DocumentChunker:
         return chunks
 
     def _get_overlap_text(self, paragraphs: list[str]) -> str:
-        """Get overlap text from previous chunk (last paragraph or partial)."""
+        """
+        Get overlap text from previous chunk (last paragraph or partial).
+
+        Overlap only needs to be about overlap_tokens long, so sizes are
+        estimated with approx_count_tokens instead of tokenizing.
+        """
         if not paragraphs:
             return ""
 
         # Try to get last paragraph
         last_para = paragraphs[-1]
-        tokens = text_processor.count_tokens(last_para)
+        tokens = approx_count_tokens(last_para)
 
         if tokens <= self.overlap_tokens:
             return last_para
@@ -266,7 +272,7 @@ class DocumentChunker:
         overlap_tokens = 0
 
         for sentence in reversed(sentences):
-            sentence_tokens = text_processor.count_tokens(sentence)
+            sentence_tokens = approx_count_tokens(sentence)
             if overlap_tokens + sentence_tokens > self.overlap_tokens:
                 break
             overlap.insert(0, sentence)
@@ -275,7 +281,7 @@ class DocumentChunker:
         return ' '.join(overlap)
 
     def _get_sentence_overlap(self, sentences: list[str]) -> str:
-        """Get overlap text from previous sentences."""
+        """Get overlap text from previous sentences (sizes estimated, as above)."""
         if not sentences:
             return ""
 
@@ -283,7 +289,7 @@ class DocumentChunker:
         overlap_tokens = 0
 
         for sentence in reversed(sentences):
-            sentence_tokens = text_processor.count_tokens(sentence)
+            sentence_tokens = approx_count_tokens(sentence)
             if overlap_tokens + sentence_tokens > self.overlap_tokens:
                 break
             overlap.insert(0, sentence)
@@ -51,7 +51,11 @@ def _load_org_data(organization_id: str) -> dict[str, Any]:
     path = _get_org_path(organization_id)
     if path.exists():
         with open(path, 'rb') as f:
-            return pickle.load(f)
+            data = pickle.load(f)
+        # vector_service saves embeddings as a single matrix
+        if isinstance(data['embeddings'], np.ndarray):
+            data['embeddings'] = list(data['embeddings'])
+        return data
     return {
         "embeddings": [],  # List of numpy arrays
         "documents": [],   # List of text chunks
@@ -62,6 +66,12 @@ def _load_org_data(organization_id: str) -> dict[str, Any]:
 
 def _save_org_data(organization_id: str, data: dict[str, Any]) -> None:
     """Save organization's vector data to disk."""
+    # Drop vector_service's derived search state (int8 matrix, normalized
+    # flag) since this module edits the lists directly; vector_service
+    # rebuilds it on next load.
+    for key in ('_matrix_q', '_scales', '_normalized'):
+        data.pop(key, None)
+
     path = _get_org_path(organization_id)
     with open(path, 'wb') as f:
         pickle.dump(data, f)
@@ -82,8 +82,8 @@ class BaseOAuthProvider(ABC):
             "prompt": "consent",  # Force consent screen to get refresh token
         }
 
-        query_string = "&".join(f"{k}={httpx.QueryParams({k: v})[k]}" for k, v in params.items())
-        return f"{self.authorization_base_url}?{query_string}"
+        # Encode all parameters in one pass
+        return f"{self.authorization_base_url}?{httpx.QueryParams(params)}"
 
     async def exchange_code_for_tokens(
         self, code: str
@@ -55,8 +55,8 @@ class SlackOAuthProvider(BaseOAuthProvider):
             "user_scope": "",  # Can add user-specific scopes if needed
         }
 
-        query_string = "&".join(f"{k}={httpx.QueryParams({k: v})[k]}" for k, v in params.items())
-        return f"{self.authorization_base_url}?{query_string}"
+        # Encode all parameters in one pass
+        return f"{self.authorization_base_url}?{httpx.QueryParams(params)}"
 
     async def exchange_code_for_tokens(self, code: str):
         """
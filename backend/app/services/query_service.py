@@ -33,7 +33,8 @@ class QueryService:
         query: str,
         organization_id: UUID,
         max_sources: int = 10,
-        use_cache: bool = True
+        use_cache: bool = True,
+        org_data: dict | None = None
     ) -> dict[str, any]:
         """
         Process complete query through RAG pipeline
@@ -45,6 +46,8 @@ class QueryService:
             organization_id: Organization ID for filtering
             max_sources: Maximum sources to retrieve
             use_cache: Whether to use cached results
+            org_data: Already loaded org vector data, shared by the
+                sub-queries of one request
 
         Returns:
             Dictionary with answer, sources, citations, and metadata
@@ -87,7 +90,8 @@ class QueryService:
             similar_docs = await search_similar_documents(
                 embedding=query_embedding,
                 organization_id=organization_id,
-                max_results=max_sources * 2  # Retrieve more than needed for better context
+                max_results=max_sources * 2,  # Retrieve more than needed for better context
+                org_data=org_data
             )
             pipeline_metrics["search_time_ms"] = int((time.time() - search_start) * 1000)
 
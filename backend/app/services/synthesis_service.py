@@ -9,8 +9,17 @@ This ensures the app works without any API keys while providing
 better quality synthesis when cloud services are available.
 """
 
+import asyncio
+import functools
+import hashlib
+import importlib.util
+import io
 import logging
 import os
+import re
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -19,12 +28,18 @@ logger = logging.getLogger(__name__)
 PROVIDER_CLAUDE = "claude"
 PROVIDER_OLLAMA = "ollama"
 
-# Current provider (determined at runtime)
-_current_provider: str | None = None
+# One follow-up question per line: optional "1." / "2)" / "-" / "*" prefix,
+# captured text with surrounding whitespace stripped
+_FOLLOWUP_RE = re.compile(r"^\s*(?:\d+[.)]\s*|[-*]\s*)?(.+?)\s*$", re.MULTILINE)
 
+# Shared Anthropic client (lazy loaded), reused across calls so the
+# underlying HTTP connection pool stays warm
+_anthropic_client = None
 
+
+@functools.lru_cache(maxsize=1)
 def _get_anthropic_api_key() -> str | None:
-    """Get Anthropic API key from settings or environment."""
+    """Get Anthropic API key from settings or environment (read once)."""
     try:
         from app.config import settings
         key = getattr(settings, 'ANTHROPIC_API_KEY', None)
@@ -37,26 +52,123 @@ def _get_anthropic_api_key() -> str | None:
     return key if key and key.strip() else None
 
 
+def _select_provider() -> str:
+    """Pick the synthesis provider based on the configured API keys."""
+    if _get_anthropic_api_key():
+        logger.info("Using Claude for AI synthesis (Anthropic API)")
+        return PROVIDER_CLAUDE
+    logger.info("Using Ollama for AI synthesis (local)")
+    return PROVIDER_OLLAMA
+
+
+# Current provider (determined once at import)
+_CURRENT_PROVIDER: str = _select_provider()
+
+
 def get_current_provider() -> str:
     """
-    Determine and return the current synthesis provider.
+    Return the current synthesis provider.
 
     Returns:
         'claude' if API key is configured, 'ollama' otherwise
     """
-    global _current_provider
+    return _CURRENT_PROVIDER
 
-    if _current_provider is not None:
-        return _current_provider
 
-    if _get_anthropic_api_key():
-        _current_provider = PROVIDER_CLAUDE
-        logger.info("Using Claude for AI synthesis (Anthropic API)")
-    else:
-        _current_provider = PROVIDER_OLLAMA
-        logger.info("Using Ollama for AI synthesis (local)")
+# ============================================================================
+# Latency-Aware Routing
+# ============================================================================
+
+# Per-provider EWMA latency plus recent call outcomes. When Claude is the
+# configured provider, requests are routed to Ollama while Claude is
+# failing often, or is much slower than a healthy Ollama.
+PROVIDER_EWMA_ALPHA = 0.2
+PROVIDER_STATS_WINDOW_SECONDS = 60.0
+PROVIDER_MAX_ERROR_RATE = 0.2
+PROVIDER_MIN_SAMPLES = 5
+PROVIDER_SLOWDOWN_FACTOR = 2.0
+
+_provider_stats: dict[str, dict[str, Any]] = {
+    provider: {"ewma_ms": 0.0, "updated_at": 0.0, "outcomes": deque()}
+    for provider in (PROVIDER_CLAUDE, PROVIDER_OLLAMA)
+}
+
+
+def _record_provider_call(provider: str, elapsed_ms: float, error: bool) -> None:
+    """Record the latency and outcome of a provider call."""
+    stats = _provider_stats[provider]
+    now = time.monotonic()
+    stats["outcomes"].append((now, error))
+    if not error:
+        if stats["ewma_ms"]:
+            stats["ewma_ms"] = (1 - PROVIDER_EWMA_ALPHA) * stats["ewma_ms"] + PROVIDER_EWMA_ALPHA * elapsed_ms
+        else:
+            stats["ewma_ms"] = elapsed_ms
+        stats["updated_at"] = now
+
 
-    return _current_provider
+def _provider_health(provider: str) -> tuple[float | None, float | None]:
+    """
+    Recent error rate and EWMA latency of a provider.
+
+    Returns:
+        Tuple of (error rate or None if too few recent calls, EWMA latency
+        in ms or None if no success within the stats window)
+    """
+    stats = _provider_stats[provider]
+    now = time.monotonic()
+    outcomes = stats["outcomes"]
+    while outcomes and now - outcomes[0][0] > PROVIDER_STATS_WINDOW_SECONDS:
+        outcomes.popleft()
+
+    error_rate = None
+    if len(outcomes) >= PROVIDER_MIN_SAMPLES:
+        error_rate = sum(error for _, error in outcomes) / len(outcomes)
+
+    ewma_ms = None
+    if stats["ewma_ms"] and now - stats["updated_at"] <= PROVIDER_STATS_WINDOW_SECONDS:
+        ewma_ms = stats["ewma_ms"]
+
+    return error_rate, ewma_ms
+
+
+def _route_provider(force_local: bool = False) -> str:
+    """Choose the provider for the next request."""
+    if force_local or _CURRENT_PROVIDER != PROVIDER_CLAUDE:
+        return PROVIDER_OLLAMA
+
+    ollama_errors, ollama_ms = _provider_health(PROVIDER_OLLAMA)
+    if ollama_errors is not None and ollama_errors > PROVIDER_MAX_ERROR_RATE:
+        return PROVIDER_CLAUDE  # No healthy fallback
+
+    claude_errors, claude_ms = _provider_health(PROVIDER_CLAUDE)
+    if claude_errors is not None and claude_errors > PROVIDER_MAX_ERROR_RATE:
+        return PROVIDER_OLLAMA
+    if claude_ms and ollama_ms and claude_ms > PROVIDER_SLOWDOWN_FACTOR * ollama_ms:
+        return PROVIDER_OLLAMA
+
+    return PROVIDER_CLAUDE
+
+
+def _get_anthropic_client():
+    """
+    Get or create the shared async Anthropic client (lazy loaded).
+
+    Reusing one client keeps its keep-alive connection pool warm across
+    calls; HTTP/2 multiplexing is enabled when the optional h2 package is
+    installed.
+    """
+    global _anthropic_client
+    if _anthropic_client is None:
+        import anthropic
+
+        _anthropic_client = anthropic.AsyncAnthropic(
+            api_key=_get_anthropic_api_key(),
+            http_client=anthropic.DefaultAsyncHttpxClient(
+                http2=importlib.util.find_spec("h2") is not None
+            ),
+        )
+    return _anthropic_client
 
 
 def get_provider_info() -> dict:
@@ -95,12 +207,14 @@ async def generate(
     system_prompt: str | None = None,
     temperature: float = 0.7,
     max_tokens: int = 2048,
-    force_local: bool = False
+    force_local: bool = False,
+    cached_prefix: str | None = None
 ) -> dict[str, Any]:
     """
     Generate text using the best available provider.
 
-    Automatically uses Claude if configured, falls back to Ollama otherwise.
+    Automatically uses Claude if configured, falls back to Ollama otherwise
+    (or while Claude is erroring or much slower than Ollama).
 
     Args:
         prompt: The user prompt
@@ -108,16 +222,23 @@ async def generate(
         temperature: Sampling temperature (0.0-1.0)
         max_tokens: Maximum tokens to generate
         force_local: Force use of Ollama even if Claude is available
+        cached_prefix: Optional text sent before the prompt that is likely
+            to repeat across calls (e.g. RAG context); marked for Anthropic
+            prompt caching
 
     Returns:
         Dictionary with response and metadata
     """
-    provider = PROVIDER_OLLAMA if force_local else get_current_provider()
+    provider = _route_provider(force_local)
+    started = time.monotonic()
 
     if provider == PROVIDER_CLAUDE:
-        return await _generate_claude(prompt, system_prompt, temperature, max_tokens)
+        result = await _generate_claude(prompt, system_prompt, temperature, max_tokens, cached_prefix)
     else:
-        return await _generate_ollama(prompt, system_prompt, temperature, max_tokens)
+        result = await _generate_ollama(prompt, system_prompt, temperature, max_tokens, cached_prefix)
+
+    _record_result(provider, started, result)
+    return result
 
 
 async def chat(
@@ -140,47 +261,130 @@ async def chat(
     Returns:
         Dictionary with response and metadata
     """
-    provider = PROVIDER_OLLAMA if force_local else get_current_provider()
+    provider = _route_provider(force_local)
+    started = time.monotonic()
 
     if provider == PROVIDER_CLAUDE:
-        return await _chat_claude(messages, system_prompt, temperature, max_tokens)
+        result = await _chat_claude(messages, system_prompt, temperature, max_tokens)
     else:
-        return await _chat_ollama(messages, temperature, max_tokens)
+        result = await _chat_ollama(messages, temperature, max_tokens)
+
+    _record_result(provider, started, result)
+    return result
+
+
+def _record_result(provider: str, started: float, result: dict[str, Any]) -> None:
+    """
+    Record a generate/chat call for routing. A Claude call that fell back
+    to Ollama internally counts as a Claude error.
+    """
+    error = not result.get("success") or result.get("provider") != provider
+    _record_provider_call(provider, (time.monotonic() - started) * 1000, error)
+
+
+async def generate_stream(
+    prompt: str,
+    system_prompt: str | None = None,
+    temperature: float = 0.7,
+    max_tokens: int = 2048,
+    force_local: bool = False,
+    cached_prefix: str | None = None
+) -> AsyncIterator[str]:
+    """
+    Stream generated text from the best available provider as it arrives.
+    Uses the same latency-aware routing as generate().
+
+    Claude output is streamed token by token. Ollama has no streaming
+    path here, so its full response is yielded once. If Claude fails
+    before producing any text, falls back to Ollama.
+
+    Args:
+        Same as generate()
+
+    Yields:
+        Text fragments of the response
+    """
+    provider = _route_provider(force_local)
+
+    if provider == PROVIDER_CLAUDE and _get_anthropic_api_key():
+        started = False
+        try:
+            client = _get_anthropic_client()
+            message_params = _claude_message_params(
+                prompt, system_prompt, temperature, max_tokens, cached_prefix
+            )
+            async with client.messages.stream(**message_params) as stream:
+                async for text in stream.text_stream:
+                    started = True
+                    yield text
+            return
+        except Exception as e:
+            if started:
+                raise
+            logger.error(f"Claude stream error: {e}, falling back to Ollama")
+
+    result = await _generate_ollama(prompt, system_prompt, temperature, max_tokens, cached_prefix)
+    if result.get("success") and result.get("response"):
+        yield result["response"]
 
 
 # ============================================================================
 # Claude Implementation
 # ============================================================================
 
+def _cached_text_block(text: str) -> dict[str, Any]:
+    """Build a text content block marked for Anthropic prompt caching."""
+    return {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}
+
+
+def _claude_message_params(
+    prompt: str,
+    system_prompt: str | None,
+    temperature: float,
+    max_tokens: int,
+    cached_prefix: str | None
+) -> dict[str, Any]:
+    """Build Messages API parameters for a single-turn Claude request."""
+    # Put the cacheable prefix in its own block ahead of the prompt
+    if cached_prefix:
+        content = [_cached_text_block(cached_prefix), {"type": "text", "text": prompt}]
+    else:
+        content = prompt
+
+    message_params = {
+        "model": "claude-3-haiku-20240307",
+        "max_tokens": max_tokens,
+        "messages": [{"role": "user", "content": content}]
+    }
+
+    if system_prompt:
+        message_params["system"] = [_cached_text_block(system_prompt)]
+
+    if temperature != 0.7:
+        message_params["temperature"] = temperature
+
+    return message_params
+
+
 async def _generate_claude(
     prompt: str,
     system_prompt: str | None,
     temperature: float,
-    max_tokens: int
+    max_tokens: int,
+    cached_prefix: str | None = None
 ) -> dict[str, Any]:
     """Generate text using Claude API."""
     api_key = _get_anthropic_api_key()
     if not api_key:
         logger.warning("Claude API key not available, falling back to Ollama")
-        return await _generate_ollama(prompt, system_prompt, temperature, max_tokens)
+        return await _generate_ollama(prompt, system_prompt, temperature, max_tokens, cached_prefix)
 
     try:
-        import anthropic
-        client = anthropic.Anthropic(api_key=api_key)
-
-        message_params = {
-            "model": "claude-3-haiku-20240307",
-            "max_tokens": max_tokens,
-            "messages": [{"role": "user", "content": prompt}]
-        }
-
-        if system_prompt:
-            message_params["system"] = system_prompt
-
-        if temperature != 0.7:
-            message_params["temperature"] = temperature
-
-        response = client.messages.create(**message_params)
+        client = _get_anthropic_client()
+        message_params = _claude_message_params(
+            prompt, system_prompt, temperature, max_tokens, cached_prefix
+        )
+        response = await client.messages.create(**message_params)
 
         return {
             "success": True,
@@ -193,7 +397,7 @@ async def _generate_claude(
 
     except Exception as e:
         logger.error(f"Claude generate error: {e}, falling back to Ollama")
-        return await _generate_ollama(prompt, system_prompt, temperature, max_tokens)
+        return await _generate_ollama(prompt, system_prompt, temperature, max_tokens, cached_prefix)
 
 
 async def _chat_claude(
@@ -209,8 +413,7 @@ async def _chat_claude(
         return await _chat_ollama(messages, temperature, max_tokens)
 
     try:
-        import anthropic
-        client = anthropic.Anthropic(api_key=api_key)
+        client = _get_anthropic_client()
 
         # Convert messages (Claude uses "user" and "assistant" only)
         claude_messages = []
@@ -232,12 +435,12 @@ async def _chat_claude(
         }
 
         if system_prompt:
-            message_params["system"] = system_prompt
+            message_params["system"] = [_cached_text_block(system_prompt)]
 
         if temperature != 0.7:
             message_params["temperature"] = temperature
 
-        response = client.messages.create(**message_params)
+        response = await client.messages.create(**message_params)
 
         return {
             "success": True,
@@ -259,11 +462,15 @@ async def _generate_ollama(
     prompt: str,
     system_prompt: str | None,
     temperature: float,
-    max_tokens: int
+    max_tokens: int,
+    cached_prefix: str | None = None
 ) -> dict[str, Any]:
     """Generate text using Ollama."""
     from app.services import ollama_service
 
+    if cached_prefix:
+        prompt = f"{cached_prefix}\n\n{prompt}"
+
     result = await ollama_service.generate(
         prompt=prompt,
         system_prompt=system_prompt,
@@ -293,6 +500,97 @@ async def _chat_ollama(
     return result
 
 
+# ============================================================================
+# Response Cache
+# ============================================================================
+
+# LRU cache of successful LLM results, keyed by a hash of the full input.
+# Entries also record a normalized query embedding so a near-identical
+# question over the same context can reuse the answer.
+RESPONSE_CACHE_SIZE = 1000
+SEMANTIC_CACHE_THRESHOLD = 0.97
+
+_response_cache: OrderedDict[str, Any] = OrderedDict()
+_semantic_index: dict[str, tuple[Any, str]] = {}  # cache key -> (query embedding, context key)
+
+
+def _cache_key(*parts: str) -> str:
+    """Hash the given input parts into a cache key."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+async def _embed_query(query: str):
+    """Unit-normalized query embedding, or None if embeddings are unavailable."""
+    from app.services import vector_service
+
+    if not vector_service.is_vector_db_configured():
+        return None
+
+    try:
+        embedding = await asyncio.to_thread(vector_service.get_embedding, query)
+    except Exception as e:
+        logger.warning(f"Query embedding for response cache failed: {e}")
+        return None
+
+    import numpy as np
+    norm = np.linalg.norm(embedding)
+    return embedding / norm if norm else None
+
+
+async def _cache_lookup(key: str, context_key: str, query: str) -> tuple[Any, Any]:
+    """
+    Look up a cached result, first by exact key and then semantically.
+
+    Returns:
+        Tuple of (cached value or None, query embedding or None). The
+        embedding is returned so a miss can be stored without re-embedding.
+    """
+    if key in _response_cache:
+        _response_cache.move_to_end(key)
+        return _response_cache[key], None
+
+    query_embedding = await _embed_query(query)
+    if query_embedding is None:
+        return None, None
+
+    candidates = [
+        (cached_key, embedding)
+        for cached_key, (embedding, cached_context) in _semantic_index.items()
+        if cached_context == context_key
+    ]
+    if candidates:
+        import numpy as np
+        scores = np.vstack([embedding for _, embedding in candidates]) @ query_embedding
+        best = int(np.argmax(scores))
+        if scores[best] >= SEMANTIC_CACHE_THRESHOLD:
+            cached_key = candidates[best][0]
+            _response_cache.move_to_end(cached_key)
+            return _response_cache[cached_key], query_embedding
+
+    return None, query_embedding
+
+
+async def _stream_text(text: str) -> AsyncIterator[str]:
+    """Yield an already complete (e.g. cached) response as a single fragment."""
+    yield text
+
+
+def _cache_store(key: str, context_key: str, value: Any, query_embedding: Any) -> None:
+    """Store a result, evicting the least recently used entries."""
+    _response_cache[key] = value
+    _response_cache.move_to_end(key)
+    if query_embedding is not None:
+        _semantic_index[key] = (query_embedding, context_key)
+
+    while len(_response_cache) > RESPONSE_CACHE_SIZE:
+        evicted_key, _ = _response_cache.popitem(last=False)
+        _semantic_index.pop(evicted_key, None)
+
+
 # ============================================================================
 # Knowledge Synthesis (RAG)
 # ============================================================================
@@ -301,7 +599,8 @@ async def synthesize_knowledge(
     query: str,
     context_chunks: list[str],
     source_documents: list[dict] | None = None,
-    force_local: bool = False
+    force_local: bool = False,
+    stream: bool = False
 ) -> dict[str, Any]:
     """
     Synthesize an answer from context chunks using the best available provider.
@@ -313,6 +612,9 @@ async def synthesize_knowledge(
         context_chunks: Relevant text chunks from documents
         source_documents: Optional metadata about source documents
         force_local: Force use of Ollama
+        stream: Return the answer as an async iterator of text fragments
+            under "stream" (with "response" None) instead of waiting for
+            the full completion
 
     Returns:
         Dictionary with synthesized answer and metadata
@@ -326,16 +628,20 @@ async def synthesize_knowledge(
             "provider": get_current_provider()
         }
 
-    # Build context string
-    context = "\n\n---\n\n".join(context_chunks[:5])
-
-    # Build source citations
-    citations = ""
-    if source_documents:
-        citations = "\n\nSources:\n" + "\n".join(
-            f"- {doc.get('title', 'Unknown')} ({doc.get('filename', 'Unknown')})"
-            for doc in source_documents[:5]
-        )
+    # Check the response cache (exact input, then similar query over the
+    # same context)
+    provider = PROVIDER_OLLAMA if force_local else get_current_provider()
+    context_key = _cache_key(
+        provider,
+        *context_chunks[:5],
+        *(f"{doc.get('title')}|{doc.get('filename')}" for doc in (source_documents or [])[:5]),
+    )
+    cache_key = _cache_key("synthesize", context_key, query)
+    cached, query_embedding = await _cache_lookup(cache_key, context_key, query)
+    if cached is not None:
+        if stream:
+            return {**cached, "query": query, "response": None, "stream": _stream_text(cached["response"])}
+        return {**cached, "query": query}
 
     system_prompt = """You are InnoSynth.ai, an enterprise knowledge synthesis assistant.
 
@@ -347,27 +653,67 @@ Your role is to:
 5. Use a professional, helpful tone
 6. Highlight key insights"""
 
-    prompt = f"""Based on the following context, please answer this question:
+    # Context goes first so it can be served from the prompt cache when the
+    # same documents are retrieved for a different question. Chunks and
+    # source citations are written in a single pass.
+    context_buffer = io.StringIO()
+    context_buffer.write("Context:\n")
+    for i, chunk in enumerate(context_chunks[:5]):
+        if i:
+            context_buffer.write("\n\n---\n\n")
+        context_buffer.write(chunk)
+    context_buffer.write("\n")
+    if source_documents:
+        context_buffer.write("\n\nSources:")
+        for doc in source_documents[:5]:
+            context_buffer.write(f"\n- {doc.get('title', 'Unknown')} ({doc.get('filename', 'Unknown')})")
+    context_block = context_buffer.getvalue()
 
-Question: {query}
+    prompt = f"""Based on the context above, please answer this question:
 
-Context:
-{context}
-{citations}
+Question: {query}
 
 Please provide a clear, accurate answer based on the context above. Cite sources when possible."""
 
-    result = await generate(
-        prompt=prompt,
-        system_prompt=system_prompt,
-        temperature=0.3,  # Lower temperature for factual answers
-        max_tokens=1500,
-        force_local=force_local
-    )
+    generation_params = {
+        "prompt": prompt,
+        "system_prompt": system_prompt,
+        "temperature": 0.3,  # Lower temperature for factual answers
+        "max_tokens": 1500,
+        "force_local": force_local,
+        "cached_prefix": context_block
+    }
+
+    if stream:
+        async def _stream_and_cache() -> AsyncIterator[str]:
+            parts = []
+            async for text in generate_stream(**generation_params):
+                parts.append(text)
+                yield text
+            if parts:
+                _cache_store(cache_key, context_key, {
+                    "success": True,
+                    "response": "".join(parts),
+                    "provider": provider,
+                    "query": query,
+                    "context_used": len(context_chunks)
+                }, query_embedding)
+
+        return {
+            "success": True,
+            "response": None,
+            "stream": _stream_and_cache(),
+            "provider": provider,
+            "query": query,
+            "context_used": len(context_chunks)
+        }
+
+    result = await generate(**generation_params)
 
     if result.get("success"):
         result["query"] = query
         result["context_used"] = len(context_chunks)
+        _cache_store(cache_key, context_key, dict(result), query_embedding)
 
     return result
 
@@ -461,7 +807,14 @@ Answer: {answer[:1500]}
 
 Generate 3 follow-up questions:"""
 
+    context_key = _cache_key(get_current_provider(), answer[:1500])
+    cache_key = _cache_key("follow_up", context_key, query)
+
     try:
+        cached, query_embedding = await _cache_lookup(cache_key, context_key, query)
+        if cached is not None:
+            return list(cached)
+
         result = await generate(
             prompt=prompt,
             system_prompt=system_prompt,
@@ -470,21 +823,16 @@ Generate 3 follow-up questions:"""
         )
 
         if result.get("success") and result.get("response"):
-            # Parse response into list of questions
-            lines = result["response"].strip().split("\n")
-            questions = []
-            for line in lines:
-                # Clean up the line
-                cleaned = line.strip()
-                # Remove common prefixes like "1.", "- ", etc.
-                cleaned = cleaned.lstrip("0123456789.-) ")
-                if cleaned and len(cleaned) > 10 and cleaned.endswith("?"):
-                    questions.append(cleaned)
-                elif cleaned and len(cleaned) > 10:
-                    # Add question mark if missing
-                    questions.append(cleaned + "?")
-
-            return questions[:3]  # Return max 3 questions
+            # Parse response into list of questions, stripping prefixes
+            # like "1." or "- " and adding a missing question mark
+            questions = [
+                match if match.endswith("?") else f"{match}?"
+                for match in _FOLLOWUP_RE.findall(result["response"])
+                if len(match) > 10
+            ][:3]  # Return max 3 questions
+            if questions:
+                _cache_store(cache_key, context_key, list(questions), query_embedding)
+            return questions
 
         return []
 
@@ -497,13 +845,33 @@ Generate 3 follow-up questions:"""
 # Status and Info
 # ============================================================================
 
-async def get_status() -> dict[str, Any]:
-    """Get status of all synthesis providers."""
-    from app.services import ollama_service
+async def get_status(include_ollama: bool = True) -> dict[str, Any]:
+    """
+    Get status of all synthesis providers.
 
+    Args:
+        include_ollama: Probe the local Ollama server. When False the probe
+            is skipped and Ollama availability is reported as None.
+    """
     claude_available = _get_anthropic_api_key() is not None
-    ollama_available = await ollama_service.is_available()
-    ollama_models = await ollama_service.get_available_models() if ollama_available else []
+    ollama_available: bool | None = None
+    ollama_models: list = []
+
+    if include_ollama:
+        from app.services import ollama_service
+
+        # Fetch the model list concurrently with the availability check,
+        # discarding it if Ollama turns out to be down
+        models_task = asyncio.create_task(ollama_service.get_available_models())
+        try:
+            ollama_available = await ollama_service.is_available()
+            if ollama_available:
+                ollama_models = await models_task
+        finally:
+            # Also reached when is_available() raises; never leave the
+            # fetch running or its exception unretrieved
+            models_task.cancel()
+            await asyncio.gather(models_task, return_exceptions=True)
 
     return {
         "current_provider": get_current_provider(),
@@ -6,19 +6,38 @@ Simple file-based persistence - no external vector DB dependency.
 NOTE: Heavy imports (numpy, openai) are lazy-loaded to reduce memory usage at startup.
 """
 
+import asyncio
+import hashlib
 import os
 import pickle
+import threading
 from typing import Any
 
 # Lazy-loaded modules
 _np = None
 _openai = None
 _openai_client = None
+_async_openai_client = None
 
 # Embedding model config
 EMBEDDING_MODEL = "text-embedding-3-small"
 EMBEDDING_DIMENSION = 1536
 
+# Embedding request batching: texts are split into sub-batches of roughly
+# this many tokens (estimated at 4 chars/token) sent concurrently, with at
+# most EMBEDDING_CONCURRENCY requests in flight per call.
+EMBEDDING_BATCH_TOKENS = 2048
+EMBEDDING_CONCURRENCY = 8
+
+# Natural chunk break points, in order of preference
+_BREAK_PUNCTS = ('. ', '.\n', '\n\n', '\n')
+
+# In-process cache of loaded org data: organization_id -> (mtime_ns, data).
+# The file mtime is checked on every load so writes from other processes
+# (or from local_vector_store, which shares the same files) invalidate it.
+_ORG_CACHE: dict[str, tuple[int, dict[str, Any]]] = {}
+_ORG_CACHE_LOCK = threading.Lock()
+
 
 def _get_numpy():
     """Lazy load numpy to reduce startup memory."""
@@ -48,6 +67,16 @@ def get_openai_client():
     return _openai_client
 
 
+def get_async_openai_client():
+    """Get or create async OpenAI client (lazy loaded)."""
+    global _async_openai_client
+    if _async_openai_client is None:
+        from app.config import settings
+        openai = _get_openai()
+        _async_openai_client = openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+    return _async_openai_client
+
+
 def _get_vector_data_dir():
     """Get vector data directory, creating if needed."""
     vector_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "vector_data")
@@ -80,31 +109,275 @@ def get_embeddings(texts: list[str]) -> list:
     return [np.array(item.embedding) for item in response.data]
 
 
+def _batch_texts(texts: list[str], max_tokens: int = EMBEDDING_BATCH_TOKENS) -> list[list[str]]:
+    """Split texts into consecutive sub-batches of roughly max_tokens each."""
+    max_chars = max_tokens * 4
+    batches: list[list[str]] = []
+    current: list[str] = []
+    current_chars = 0
+    for text in texts:
+        if current and current_chars + len(text) > max_chars:
+            batches.append(current)
+            current, current_chars = [], 0
+        current.append(text)
+        current_chars += len(text)
+    if current:
+        batches.append(current)
+    return batches
+
+
+async def get_embeddings_async(texts: list[str]) -> list:
+    """
+    Get embeddings for multiple texts without blocking the event loop.
+
+    Texts are split into size-bounded sub-batches that are sent concurrently,
+    bounded by EMBEDDING_CONCURRENCY in-flight requests. Results are returned
+    in input order.
+    """
+    if not texts:
+        return []
+
+    np = _get_numpy()
+    client = get_async_openai_client()
+    semaphore = asyncio.Semaphore(EMBEDDING_CONCURRENCY)
+
+    async def _embed_batch(batch: list[str]):
+        async with semaphore:
+            return await client.embeddings.create(model=EMBEDDING_MODEL, input=batch)
+
+    responses = await asyncio.gather(*[_embed_batch(batch) for batch in _batch_texts(texts)])
+    return [np.array(item.embedding) for response in responses for item in response.data]
+
+
 def get_org_data_path(organization_id: str) -> str:
     """Get the path to an organization's vector data file."""
     safe_id = organization_id.replace('-', '_')
     return os.path.join(_get_vector_data_dir(), f"org_{safe_id}.pkl")
 
 
-def load_org_data(organization_id: str) -> dict[str, Any]:
-    """Load organization's vector data from disk."""
-    path = get_org_data_path(organization_id)
-    if os.path.exists(path):
-        with open(path, 'rb') as f:
-            return pickle.load(f)
+def _empty_org_data() -> dict[str, Any]:
+    """Return an empty organization data structure."""
     return {
-        "embeddings": [],  # List of numpy arrays
+        "embeddings": [],  # List of unit-length numpy arrays
         "documents": [],   # List of text chunks
         "metadatas": [],   # List of metadata dicts
-        "ids": []          # List of chunk IDs
+        "ids": [],         # List of chunk IDs
+        "_normalized": True
     }
 
 
+def _normalize(embedding):
+    """Scale an embedding to unit length (zero vectors are left as-is)."""
+    np = _get_numpy()
+    embedding = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(embedding)
+    return embedding / norm if norm else embedding
+
+
+def _migrate_org_data(data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Convert org data as stored on disk to its in-memory form: embeddings
+    saved as one matrix become a list of row views, and embeddings stored
+    by older versions (or other writers) are normalized.
+    """
+    np = _get_numpy()
+    if isinstance(data['embeddings'], np.ndarray):
+        data['embeddings'] = list(data['embeddings'])
+    if not data.get('_normalized'):
+        data['embeddings'] = [_normalize(e) for e in data['embeddings']]
+        data.pop('_scales', None)
+        data['_normalized'] = True
+    return data
+
+
+def load_org_data(organization_id: str) -> dict[str, Any]:
+    """
+    Load organization's vector data, reusing the in-process copy when the
+    file on disk has not changed since it was last read or written.
+
+    The returned dict is shared with the cache; callers that mutate it
+    must persist the result with save_org_data.
+    """
+    path = get_org_data_path(organization_id)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        with _ORG_CACHE_LOCK:
+            _ORG_CACHE.pop(organization_id, None)
+        return _empty_org_data()
+
+    with _ORG_CACHE_LOCK:
+        cached = _ORG_CACHE.get(organization_id)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+    with open(path, 'rb') as f:
+        data = _migrate_org_data(pickle.load(f))
+
+    with _ORG_CACHE_LOCK:
+        _ORG_CACHE[organization_id] = (mtime_ns, data)
+    return data
+
+
+def _to_disk_format(data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Prepare org data for pickling: embeddings are stacked into a single
+    contiguous float32 matrix, which pickles as one raw buffer instead of
+    one object per chunk. Mixed-dimension lists are left as they are.
+    """
+    np = _get_numpy()
+    if not data['embeddings']:
+        return data
+    try:
+        embeddings = np.vstack(data['embeddings']).astype(np.float32, copy=False)
+    except ValueError:
+        return data
+    return {**data, 'embeddings': embeddings}
+
+
+def _get_count_path(data_path: str) -> str:
+    """Get the path of the chunk-count sidecar for an org data file."""
+    return os.path.splitext(data_path)[0] + ".count"
+
+
 def save_org_data(organization_id: str, data: dict[str, Any]) -> None:
-    """Save organization's vector data to disk."""
+    """
+    Save organization's vector data to disk and refresh the cache entry.
+
+    Also writes a small sidecar with the chunk count so overall index
+    stats do not need to unpickle every org file.
+    """
+    _sync_search_matrix(data)
     path = get_org_data_path(organization_id)
-    with open(path, 'wb') as f:
-        pickle.dump(data, f)
+    with _ORG_CACHE_LOCK:
+        with open(path, 'wb') as f:
+            pickle.dump(_to_disk_format(data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        with open(_get_count_path(path), 'w') as f:
+            f.write(str(len(data['embeddings'])))
+        _ORG_CACHE[organization_id] = (os.stat(path).st_mtime_ns, data)
+
+
+def _count_org_chunks(path: str) -> int:
+    """
+    Count the chunks in an org data file, from its sidecar when it is at
+    least as new as the data file (other writers don't update it).
+    """
+    count_path = _get_count_path(path)
+    try:
+        if os.stat(count_path).st_mtime_ns >= os.stat(path).st_mtime_ns:
+            with open(count_path) as f:
+                return int(f.read())
+    except (OSError, ValueError):
+        pass
+
+    with open(path, 'rb') as f:
+        return len(pickle.load(f).get('embeddings', []))
+
+
+def _quantize(matrix):
+    """
+    Quantize the rows of a float matrix to int8 with a per-row scale.
+
+    Returns:
+        Tuple of (int8 matrix, float32 scales) such that
+        ``matrix ~= q * scales[:, None]``
+    """
+    np = _get_numpy()
+    matrix = np.atleast_2d(np.asarray(matrix, dtype=np.float32))
+    max_abs = np.abs(matrix).max(axis=1)
+    max_abs[max_abs == 0] = 1.0
+    q = np.rint(matrix / max_abs[:, None] * 127).astype(np.int8)
+    return q, (max_abs / 127).astype(np.float32)
+
+
+def _quantize_embeddings(embeddings: list):
+    """Quantize unit-length float embeddings into int8 search-matrix rows."""
+    np = _get_numpy()
+    return _quantize(np.vstack(embeddings))
+
+
+def _sync_search_matrix(data: dict[str, Any]) -> None:
+    """
+    Bring the int8 search matrix used for scoring up to date with the
+    float embeddings, which are kept alongside for re-indexing.
+
+    Rows removed through _remove_chunks are already filtered out of the
+    matrix, so only newly appended embeddings need quantizing. Code that
+    replaces embeddings in place must drop '_scales' to force a rebuild.
+    """
+    np = _get_numpy()
+    total = len(data['embeddings'])
+    indexed = len(data.get('_scales', ()))
+    if indexed == total:
+        return
+
+    if not data['embeddings']:
+        data['_matrix_q'] = np.empty((0, EMBEDDING_DIMENSION), dtype=np.int8)
+        data['_scales'] = np.empty(0, dtype=np.float32)
+    elif 0 < indexed < total:
+        matrix_q, scales = _quantize_embeddings(data['embeddings'][indexed:])
+        data['_matrix_q'] = np.concatenate([data['_matrix_q'], matrix_q])
+        data['_scales'] = np.concatenate([data['_scales'], scales])
+    else:
+        data['_matrix_q'], data['_scales'] = _quantize_embeddings(data['embeddings'])
+
+
+def _document_indices(data: dict[str, Any], document_id: str) -> list[int]:
+    """Indices of a document's chunks in the org data."""
+    return [i for i, m in enumerate(data['metadatas']) if m.get('document_id') == document_id]
+
+
+def _remove_chunks(data: dict[str, Any], indices: list[int]) -> None:
+    """Remove the chunks at the given indices in a single pass per list."""
+    if not indices:
+        return
+
+    np = _get_numpy()
+    keep_mask = np.ones(len(data['ids']), dtype=bool)
+    keep_mask[indices] = False
+
+    for field in ('embeddings', 'documents', 'metadatas', 'ids'):
+        data[field] = [item for item, keep in zip(data[field], keep_mask) if keep]
+
+    if len(data.get('_scales', ())) == len(keep_mask):
+        data['_matrix_q'] = data['_matrix_q'][keep_mask]
+        data['_scales'] = data['_scales'][keep_mask]
+    else:
+        data.pop('_scales', None)
+
+
+def _score_embeddings(data: dict[str, Any], query_embedding):
+    """
+    Cosine similarity of the query against every stored chunk.
+
+    Stored embeddings are unit length, so after normalizing the query once
+    the cosine is a single (scaled int8) dot product per row.
+    """
+    np = _get_numpy()
+    # Also quantizes legacy files saved before the int8 matrix existed
+    _sync_search_matrix(data)
+
+    query_q, query_scale = _quantize(_normalize(query_embedding))
+    dots = np.einsum("ij,j->i", data['_matrix_q'], query_q[0], dtype=np.int32)
+    return dots.astype(np.float32) * data['_scales'] * query_scale[0]
+
+
+def _top_k(scores, k: int, min_score: float):
+    """
+    Indices of the k highest scores that are >= min_score, best first.
+
+    Uses argpartition so only the k winners are sorted, rather than every
+    candidate above the threshold.
+    """
+    np = _get_numpy()
+    candidates = (scores >= min_score).nonzero()[0]
+    if k <= 0 or len(candidates) == 0:
+        return candidates[:0]
+    candidate_scores = scores[candidates]
+    if len(candidates) > k:
+        top = np.argpartition(-candidate_scores, k - 1)[:k]
+        candidates, candidate_scores = candidates[top], candidate_scores[top]
+    return candidates[np.argsort(-candidate_scores, kind="stable")]
 
 
 def is_vector_db_configured() -> bool:
@@ -132,13 +405,17 @@ def chunk_text(text: str, chunk_size: int = 500, overlap: int = 50) -> list[str]
     start = 0
     text_length = len(text)
 
+    half_chunk = chunk_size // 2
+
     while start < text_length:
         end = start + chunk_size
 
-        # Try to find a natural break point (sentence end or newline)
+        # Try to find a natural break point (sentence end or newline).
+        # rfind is bounded to the back half of the window, so total work
+        # stays linear in len(text).
         if end < text_length:
-            for punct in ['. ', '.\n', '\n\n', '\n']:
-                break_point = text.rfind(punct, start + chunk_size // 2, end)
+            for punct in _BREAK_PUNCTS:
+                break_point = text.rfind(punct, start + half_chunk, end)
                 if break_point != -1:
                     end = break_point + len(punct)
                     break
@@ -154,17 +431,16 @@ def chunk_text(text: str, chunk_size: int = 500, overlap: int = 50) -> list[str]
     return chunks
 
 
+def _hash_chunk(chunk: str) -> str:
+    """Content hash of a chunk, used to skip re-embedding unchanged text."""
+    return hashlib.blake2b(chunk.encode("utf-8"), digest_size=16).hexdigest()
+
+
 def generate_chunk_id(document_id: str, chunk_index: int) -> str:
     """Generate a unique ID for a chunk."""
     return f"{document_id}_chunk_{chunk_index}"
 
 
-def cosine_similarity(a, b) -> float:
-    """Calculate cosine similarity between two vectors."""
-    np = _get_numpy()
-    return float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b)))
-
-
 async def index_document(
     document_id: str,
     organization_id: str,
@@ -188,28 +464,41 @@ async def index_document(
     if not content:
         return 0
 
-    data = load_org_data(organization_id)
-
-    # Remove existing chunks for this document (re-indexing)
-    existing_indices = [i for i, m in enumerate(data['metadatas']) if m.get('document_id') == document_id]
-    for i in sorted(existing_indices, reverse=True):
-        data['embeddings'].pop(i)
-        data['documents'].pop(i)
-        data['metadatas'].pop(i)
-        data['ids'].pop(i)
-
-    # Chunk the document
     chunks = chunk_text(content)
+    chunk_hashes = [_hash_chunk(chunk) for chunk in chunks]
+
+    data = load_org_data(organization_id)
+    existing_indices = _document_indices(data, document_id)
+
+    # On re-index, reuse embeddings of chunks whose text is unchanged and
+    # only embed the rest. Embeddings are generated before the (cached) org
+    # data is modified, so a failed OpenAI call leaves it untouched.
+    existing_by_hash = {
+        data['metadatas'][i]['chunk_hash']: data['embeddings'][i]
+        for i in existing_indices
+        if 'chunk_hash' in data['metadatas'][i]
+    }
+    to_embed = [i for i, h in enumerate(chunk_hashes) if h not in existing_by_hash]
+    new_embeddings = await get_embeddings_async([chunks[i] for i in to_embed])
+    embedded = dict(zip(to_embed, new_embeddings))
+    embeddings = [
+        embedded[i] if i in embedded else existing_by_hash[h]
+        for i, h in enumerate(chunk_hashes)
+    ]
+
+    # Remove existing chunks for this document (re-indexing). The org data
+    # is shared and may have changed during the await above, so look the
+    # document's rows up again rather than reusing existing_indices.
+    data = load_org_data(organization_id)
+    _remove_chunks(data, _document_indices(data, document_id))
 
     if not chunks:
         save_org_data(organization_id, data)
         return 0
 
-    # Generate embeddings for all chunks using OpenAI
-    embeddings = get_embeddings(chunks)
-
-    # Add new chunks
-    from datetime import datetime  # Lazy import
+    # Add new chunks (all stamped with the same indexing time)
+    from datetime import UTC, datetime  # Lazy import
+    indexed_at = datetime.now(UTC).isoformat()
     for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
         chunk_id = generate_chunk_id(document_id, i)
         chunk_metadata = {
@@ -217,11 +506,12 @@ async def index_document(
             "title": title,
             "chunk_index": i,
             "total_chunks": len(chunks),
-            "indexed_at": datetime.utcnow().isoformat(),
+            "chunk_hash": chunk_hashes[i],
+            "indexed_at": indexed_at,
             **(metadata or {})
         }
 
-        data['embeddings'].append(embedding)
+        data['embeddings'].append(_normalize(embedding))
         data['documents'].append(chunk)
         data['metadatas'].append(chunk_metadata)
         data['ids'].append(chunk_id)
@@ -247,13 +537,8 @@ async def remove_document_embedding(document_id: str, organization_id: str) -> b
         data = load_org_data(organization_id)
 
         # Find and remove all chunks for this document
-        indices_to_remove = [i for i, m in enumerate(data['metadatas']) if m.get('document_id') == document_id]
-
-        for i in sorted(indices_to_remove, reverse=True):
-            data['embeddings'].pop(i)
-            data['documents'].pop(i)
-            data['metadatas'].pop(i)
-            data['ids'].pop(i)
+        indices_to_remove = _document_indices(data, document_id)
+        _remove_chunks(data, indices_to_remove)
 
         save_org_data(organization_id, data)
         return True
@@ -272,7 +557,8 @@ async def search_similar_documents(
     query: str,
     organization_id: str,
     max_results: int = 10,
-    min_score: float = 0.3
+    min_score: float = 0.3,
+    org_data: dict[str, Any] | None = None
 ) -> list:
     """
     Search for similar documents using semantic search.
@@ -282,34 +568,31 @@ async def search_similar_documents(
         organization_id: Organization to search in
         max_results: Maximum number of results
         min_score: Minimum similarity score (0-1)
+        org_data: Already loaded org data (see load_org_data), to avoid
+            loading it again within one request
 
     Returns:
         List of Source objects with relevance scores
     """
     from app.schemas import Source  # Lazy import
 
-    data = load_org_data(organization_id)
+    data = org_data if org_data is not None else load_org_data(organization_id)
 
     if not data['embeddings']:
         return []
 
     query_embedding = get_embedding(query)
 
-    # Calculate similarities
-    similarities = []
-    for i, emb in enumerate(data['embeddings']):
-        sim = cosine_similarity(query_embedding, emb)
-        if sim >= min_score:
-            similarities.append((i, sim))
-
-    # Sort by similarity (descending)
-    similarities.sort(key=lambda x: x[1], reverse=True)
+    # Calculate similarities and keep the best candidates (descending)
+    scores = _score_embeddings(data, query_embedding)
+    top_indices = _top_k(scores, max_results * 2, min_score)  # Get more to account for dedup
 
     # Deduplicate by document and create Source objects
     sources = []
     seen_documents = set()
 
-    for idx, similarity in similarities[:max_results * 2]:  # Get more to account for dedup
+    for idx in top_indices:
+        similarity = float(scores[idx])
         metadata = data['metadatas'][idx]
         doc_id = metadata.get('document_id', data['ids'][idx])
 
@@ -336,7 +619,8 @@ async def search_similar(
     query: str,
     organization_id: str,
     limit: int = 10,
-    min_score: float = 0.3
+    min_score: float = 0.3,
+    org_data: dict[str, Any] | None = None
 ) -> list[dict[str, Any]]:
     """
     Search for similar content (returns raw results).
@@ -346,47 +630,49 @@ async def search_similar(
         organization_id: Organization to search in
         limit: Maximum number of results
         min_score: Minimum similarity score (0-1)
+        org_data: Already loaded org data (see load_org_data), to avoid
+            loading it again within one request
 
     Returns:
         List of results with document info and similarity scores
     """
-    data = load_org_data(organization_id)
+    data = org_data if org_data is not None else load_org_data(organization_id)
 
     if not data['embeddings']:
         return []
 
     query_embedding = get_embedding(query)
 
-    # Calculate similarities
-    results = []
-    for i, emb in enumerate(data['embeddings']):
-        sim = cosine_similarity(query_embedding, emb)
-        if sim >= min_score:
-            results.append({
-                "chunk_id": data['ids'][i],
-                "content": data['documents'][i],
-                "metadata": data['metadatas'][i],
-                "similarity": round(sim, 4)
-            })
-
-    # Sort by similarity (descending) and limit
-    results.sort(key=lambda x: x['similarity'], reverse=True)
-    return results[:limit]
+    # Calculate similarities and select the top results (descending)
+    scores = _score_embeddings(data, query_embedding)
+    return [
+        {
+            "chunk_id": data['ids'][i],
+            "content": data['documents'][i],
+            "metadata": data['metadatas'][i],
+            "similarity": round(float(scores[i]), 4)
+        }
+        for i in _top_k(scores, limit, min_score)
+    ]
 
 
-async def get_index_stats(organization_id: str | None = None) -> dict:
+async def get_index_stats(
+    organization_id: str | None = None,
+    org_data: dict[str, Any] | None = None
+) -> dict:
     """
     Get statistics about the vector index.
 
     Args:
         organization_id: Specific organization, or None for overall stats
+        org_data: Already loaded data for organization_id, if available
 
     Returns:
         Dictionary with index statistics
     """
     try:
         if organization_id:
-            data = load_org_data(organization_id)
+            data = org_data if org_data is not None else load_org_data(organization_id)
             unique_docs = set(m.get('document_id') for m in data['metadatas'])
             return {
                 "total_chunks": len(data['embeddings']),
@@ -395,21 +681,20 @@ async def get_index_stats(organization_id: str | None = None) -> dict:
                 "embedding_dimension": EMBEDDING_DIMENSION
             }
         else:
-            # Get stats for all organizations
-            total_chunks = 0
-            total_orgs = 0
+            # Get stats for all organizations, counting files concurrently
             vector_dir = _get_vector_data_dir()
-            for filename in os.listdir(vector_dir):
-                if filename.endswith('.pkl'):
-                    total_orgs += 1
-                    filepath = os.path.join(vector_dir, filename)
-                    with open(filepath, 'rb') as f:
-                        org_data = pickle.load(f)
-                        total_chunks += len(org_data.get('embeddings', []))
+            paths = [
+                os.path.join(vector_dir, filename)
+                for filename in os.listdir(vector_dir)
+                if filename.endswith('.pkl')
+            ]
+            counts = await asyncio.gather(
+                *[asyncio.to_thread(_count_org_chunks, path) for path in paths]
+            )
 
             return {
-                "total_organizations": total_orgs,
-                "total_chunks": total_chunks,
+                "total_organizations": len(paths),
+                "total_chunks": sum(counts),
                 "embedding_model": EMBEDDING_MODEL,
                 "embedding_dimension": EMBEDDING_DIMENSION
             }
@@ -430,19 +715,15 @@ async def upsert_document_embedding(
     Legacy function - use index_document instead for full functionality.
     This maintains backward compatibility.
     """
-    np = _get_numpy()
     data = load_org_data(organization_id)
 
     # Remove existing if present
     existing_idx = next((i for i, id_ in enumerate(data['ids']) if id_ == document_id), None)
     if existing_idx is not None:
-        data['embeddings'].pop(existing_idx)
-        data['documents'].pop(existing_idx)
-        data['metadatas'].pop(existing_idx)
-        data['ids'].pop(existing_idx)
+        _remove_chunks(data, [existing_idx])
 
     # Add new
-    data['embeddings'].append(np.array(embedding))
+    data['embeddings'].append(_normalize(embedding))
     data['documents'].append("")
     data['metadatas'].append({"document_id": document_id, **metadata})
     data['ids'].append(document_id)
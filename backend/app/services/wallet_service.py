@@ -8,29 +8,45 @@ GoHighLevel-style wallet system for usage-based billing:
 """
 
 import logging
+from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 
-from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import event, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, load_only
 
 from app.models.organization import Organization
 
 logger = logging.getLogger(__name__)
 
 
-# Cost per AI operation (in USD)
+# Cost per AI operation, in micro-USD (1 USD = 1_000_000). Costs stay
+# integers on the hot path; Decimal only at the wallet column boundary.
+MICROS_PER_USD = 1_000_000
+DEFAULT_AI_COST = 10_000  # $0.01
+
 AI_COSTS = {
-    "chat_message": Decimal("0.01"),      # ~1000 tokens
-    "lead_scoring": Decimal("0.005"),     # Quick analysis
-    "daily_insights": Decimal("0.02"),    # Dashboard generation
-    "signature_extraction": Decimal("0.01"),
-    "duplicate_detection": Decimal("0.005"),
+    "chat_message": 10_000,           # ~1000 tokens
+    "lead_scoring": 5_000,            # Quick analysis
+    "daily_insights": 20_000,         # Dashboard generation
+    "signature_extraction": 10_000,
+    "duplicate_detection": 5_000,
 }
 
 
-class WalletTransaction(BaseModel):
+# Agency markup as Decimal, keyed by agency ID: (markup float, Decimal).
+# Avoids a float -> str -> Decimal parse on every rebilled operation.
+_markup_cache: dict[str, tuple[float, Decimal]] = {}
+
+
+def micros_to_usd(micros: int) -> Decimal:
+    """Convert an integer micro-USD amount to a Decimal USD amount."""
+    return Decimal(micros).scaleb(-6)
+
+
+@dataclass(slots=True, frozen=True)
+class WalletTransaction:
     """Wallet transaction record"""
     org_id: str
     amount: Decimal
@@ -40,7 +56,8 @@ class WalletTransaction(BaseModel):
     created_at: datetime
 
 
-class WalletSummary(BaseModel):
+@dataclass(slots=True, frozen=True)
+class WalletSummary:
     """Wallet status summary"""
     balance: Decimal
     auto_recharge_enabled: bool
@@ -79,6 +96,11 @@ class WalletService:
         if not org:
             raise ValueError(f"Organization not found: {org_id}")
 
+        return self._summary(org)
+
+    @staticmethod
+    def _summary(org: Organization) -> WalletSummary:
+        """Build a wallet summary from a loaded organization."""
         return WalletSummary(
             balance=org.wallet_balance,
             auto_recharge_enabled=org.wallet_auto_recharge,
@@ -92,50 +114,115 @@ class WalletService:
         org_id: str,
         amount: Decimal,
         description: str,
-        operation_type: str = "ai_operation"
+        operation_type: str = "ai_operation",
+        commit: bool = True,
+        recharge: bool = True
     ) -> bool:
         """
         Deduct from wallet. Returns False if insufficient funds.
 
+        The debit is a single conditional UPDATE, so concurrent calls
+        cannot both spend the same balance.
+
         Args:
             org_id: Organization ID
             amount: Amount to deduct
             description: Transaction description
             operation_type: Type of AI operation
+            commit: Commit the debit; pass False to batch it with other
+                writes in the caller's transaction
+            recharge: Auto-recharge inline when the balance is short; pass
+                False inside a savepoint and use recharge_if_short first
 
         Returns:
             True if deduction successful, False if insufficient funds
         """
-        org = await self.get_organization(org_id)
-        if not org:
-            raise ValueError(f"Organization not found: {org_id}")
+        row = await self._debit(org_id, amount)
+
+        if row is None:
+            # Insufficient balance (or unknown org): try auto-recharge
+            org = await self.db.get(Organization, org_id)
+            if not org:
+                raise ValueError(f"Organization not found: {org_id}")
 
-        # Check if sufficient balance
-        if org.wallet_balance < amount:
-            # Try auto-recharge if enabled
-            if org.wallet_auto_recharge and org.stripe_customer_id:
-                recharged = await self._trigger_recharge(org)
-                if not recharged:
-                    logger.warning(f"Auto-recharge failed for org {org_id}")
-                    return False
-            else:
+            if not (recharge and org.wallet_auto_recharge and org.stripe_customer_id):
                 logger.info(f"Insufficient balance for org {org_id}: {org.wallet_balance} < {amount}")
                 return False
 
-        # Deduct amount
-        org.wallet_balance -= amount
-        await self.db.commit()
+            recharged = await self._trigger_recharge(org, commit=commit)
+            if not recharged:
+                logger.warning(f"Auto-recharge failed for org {org_id}")
+                return False
+
+            row = await self._debit(org_id, amount)
+            if row is None:
+                logger.info(f"Insufficient balance for org {org_id} after recharge")
+                return False
+
+        if commit:
+            await self.db.commit()
 
         logger.info(f"Deducted {amount} from org {org_id}: {description}")
 
-        # Check if we should trigger auto-recharge after deduction
-        if (org.wallet_auto_recharge and
-            org.stripe_customer_id and
-            org.wallet_balance <= org.wallet_recharge_threshold):
-            await self._trigger_recharge(org)
+        # Check if we should trigger auto-recharge after deduction. This
+        # debit already succeeded, so hand the recharge to the background
+        # worker instead of holding the request on Stripe.
+        if (row.wallet_auto_recharge and
+            row.stripe_customer_id and
+            row.wallet_balance <= row.wallet_recharge_threshold):
+            from app.workers.recharge_worker import enqueue_recharge
+
+            if not commit:
+                # The worker reads committed balances; queue once the
+                # caller's transaction commits. Without a worker, the next
+                # debit that runs short recharges inline.
+                event.listen(
+                    self.db.sync_session,
+                    "after_commit",
+                    lambda session: enqueue_recharge(org_id),
+                    once=True,
+                )
+            elif not enqueue_recharge(org_id):
+                org = await self.db.get(Organization, org_id)
+                await self._trigger_recharge(org)
 
         return True
 
+    async def recharge_if_short(self, org: Organization, amount: Decimal) -> None:
+        """
+        Auto-recharge, and commit, if the wallet cannot cover amount.
+
+        A recharge charges the customer's card, so its credit must not be
+        rolled back along with a failed debit in the caller's savepoint.
+        """
+        if (org.wallet_balance < amount and
+            org.wallet_auto_recharge and
+            org.stripe_customer_id):
+            await self._trigger_recharge(org)
+
+    async def _debit(self, org_id: str, amount: Decimal):
+        """
+        Atomically subtract amount if the balance covers it.
+
+        Returns the updated wallet columns, or None when no row matched
+        (insufficient balance or unknown organization).
+        """
+        result = await self.db.execute(
+            update(Organization)
+            .where(
+                Organization.organization_id == org_id,
+                Organization.wallet_balance >= amount,
+            )
+            .values(wallet_balance=Organization.wallet_balance - amount)
+            .returning(
+                Organization.wallet_balance,
+                Organization.wallet_auto_recharge,
+                Organization.stripe_customer_id,
+                Organization.wallet_recharge_threshold,
+            )
+        )
+        return result.one_or_none()
+
     async def add_credits(
         self,
         org_id: str,
@@ -155,18 +242,22 @@ class WalletService:
         Returns:
             New balance after adding credits
         """
-        org = await self.get_organization(org_id)
-        if not org:
+        result = await self.db.execute(
+            update(Organization)
+            .where(Organization.organization_id == org_id)
+            .values(wallet_balance=Organization.wallet_balance + amount)
+            .returning(Organization.wallet_balance)
+        )
+        balance = result.scalar_one_or_none()
+        if balance is None:
             raise ValueError(f"Organization not found: {org_id}")
 
-        org.wallet_balance += amount
         await self.db.commit()
-        await self.db.refresh(org)
 
         logger.info(f"Added {amount} credits to org {org_id}: {description}")
-        return org.wallet_balance
+        return balance
 
-    async def _trigger_recharge(self, org: Organization) -> bool:
+    async def _trigger_recharge(self, org: Organization, commit: bool = True) -> bool:
         """
         Trigger auto-recharge via Stripe.
 
@@ -203,8 +294,16 @@ class WalletService:
             f"Auto-recharge triggered for org {org.organization_id}: "
             f"${org.wallet_recharge_amount}"
         )
-        org.wallet_balance += org.wallet_recharge_amount
-        await self.db.commit()
+        # Credit with an UPDATE, like _debit: the session does not autoflush,
+        # so an attribute change would be invisible to the re-debit in deduct
+        # (and would overwrite concurrent debits when it did flush).
+        await self.db.execute(
+            update(Organization)
+            .where(Organization.organization_id == org.organization_id)
+            .values(wallet_balance=Organization.wallet_balance + org.wallet_recharge_amount)
+        )
+        if commit:
+            await self.db.commit()
 
         return True
 
@@ -244,10 +343,10 @@ class WalletService:
             org.wallet_recharge_threshold = recharge_threshold
 
         await self.db.commit()
-        await self.db.refresh(org)
 
+        # The session keeps the values just written; no refresh needed
         logger.info(f"Updated auto-recharge settings for org {org_id}")
-        return await self.get_wallet_summary(org_id)
+        return self._summary(org)
 
     async def deduct_for_operation(
         self,
@@ -268,11 +367,11 @@ class WalletService:
         """
         if operation not in AI_COSTS:
             logger.warning(f"Unknown operation type: {operation}")
-            base_cost = Decimal("0.01")  # Default cost
+            base_micros = DEFAULT_AI_COST
         else:
-            base_cost = AI_COSTS[operation]
+            base_micros = AI_COSTS[operation]
 
-        amount = base_cost * Decimal(str(multiplier))
+        amount = micros_to_usd(round(base_micros * multiplier))
         return await self.deduct(org_id, amount, f"AI: {operation}")
 
 
@@ -297,6 +396,36 @@ class RebillingService:
         )
         return result.scalar_one_or_none()
 
+    async def get_client_with_agency(self, client_id: str) -> Organization | None:
+        """
+        Get a client organization with its parent agency joined in (one query).
+
+        Only the columns rebilling reads are loaded. Wallet columns must
+        stay in this list:
+        WalletService reuses these rows from the identity map, and an
+        unloaded attribute would lazy-load outside the async context.
+        """
+        wallet_columns = (
+            Organization.name,
+            Organization.parent_organization_id,
+            Organization.wallet_balance,
+            Organization.wallet_auto_recharge,
+            Organization.wallet_recharge_amount,
+            Organization.wallet_recharge_threshold,
+            Organization.stripe_customer_id,
+        )
+        result = await self.db.execute(
+            select(Organization)
+            .options(
+                load_only(*wallet_columns),
+                joinedload(Organization.parent).load_only(
+                    *wallet_columns, Organization.features
+                ),
+            )
+            .where(Organization.organization_id == client_id)
+        )
+        return result.scalar_one_or_none()
+
     async def calculate_client_cost(
         self,
         client_id: str,
@@ -312,7 +441,7 @@ class RebillingService:
         Returns:
             Cost to charge client (with agency markup applied)
         """
-        client = await self.get_organization(client_id)
+        client = await self.get_client_with_agency(client_id)
         if not client:
             return base_cost
 
@@ -320,7 +449,11 @@ class RebillingService:
         if not client.parent_organization_id:
             return base_cost  # Direct client, no markup
 
-        agency = await self.get_organization(client.parent_organization_id)
+        return self._apply_markup(client.parent, base_cost)
+
+    @staticmethod
+    def _apply_markup(agency: Organization | None, base_cost: Decimal) -> Decimal:
+        """Apply an agency's rebilling markup to a base cost."""
         if not agency:
             return base_cost
 
@@ -336,7 +469,15 @@ class RebillingService:
         # Clamp markup to allowed range
         markup = min(max(1.0, markup), max_markup)
 
-        client_cost = base_cost * Decimal(str(markup))
+        agency_id = str(agency.organization_id)
+        cached = _markup_cache.get(agency_id)
+        if cached and cached[0] == markup:
+            dec_markup = cached[1]
+        else:
+            dec_markup = Decimal(str(markup))
+            _markup_cache[agency_id] = (markup, dec_markup)
+
+        client_cost = base_cost * dec_markup
         return client_cost
 
     async def process_rebilled_operation(
@@ -354,15 +495,15 @@ class RebillingService:
 
         Returns dict with costs and success status.
         """
-        client = await self.get_organization(client_id)
+        client = await self.get_client_with_agency(client_id)
         if not client:
             raise ValueError(f"Client not found: {client_id}")
 
         # Get base cost
         if operation not in AI_COSTS:
-            base_cost = Decimal("0.01")
+            base_cost = micros_to_usd(DEFAULT_AI_COST)
         else:
-            base_cost = AI_COSTS[operation] * Decimal(str(multiplier))
+            base_cost = micros_to_usd(round(AI_COSTS[operation] * multiplier))
 
         result = {
             "operation": operation,
@@ -380,32 +521,52 @@ class RebillingService:
             result["success"] = success
             return result
 
+        # Agency was loaded with the client; reused for markup and its debit
+        agency = client.parent
+        if not agency:
+            raise ValueError(f"Agency not found: {client.parent_organization_id}")
+
         # Calculate client cost with markup
-        client_cost = await self.calculate_client_cost(client_id, base_cost)
+        client_cost = self._apply_markup(agency, base_cost)
         result["client_cost"] = client_cost
         result["agency_profit"] = client_cost - base_cost
 
+        # Recharge short wallets up front, outside the savepoint below, so
+        # a failed debit cannot roll back a credit that was already charged.
+        await self.wallet_service.recharge_if_short(client, client_cost)
+        await self.wallet_service.recharge_if_short(agency, base_cost)
+
+        # Debit both wallets in one transaction (one commit). The client
+        # debit sits in a savepoint so a failed agency debit rolls it back
+        # instead of issuing a compensating refund.
+        savepoint = await self.db.begin_nested()
+
         # Deduct from client wallet first
         client_success = await self.wallet_service.deduct(
-            client_id, client_cost, f"AI: {operation}"
+            client_id, client_cost, f"AI: {operation}",
+            commit=False, recharge=False
         )
         if not client_success:
+            await savepoint.rollback()
             return result
 
         # Deduct base cost from agency wallet
         agency_success = await self.wallet_service.deduct(
-            client.parent_organization_id,
+            agency.organization_id,
             base_cost,
-            f"AI (rebilled from {client.name}): {operation}"
+            f"AI (rebilled from {client.name}): {operation}",
+            commit=False,
+            recharge=False
         )
 
         if not agency_success:
-            # Refund client if agency deduction fails
-            await self.wallet_service.add_credits(
-                client_id, client_cost, f"Refund: {operation}", "refund"
-            )
+            # Undo the client debit
+            await savepoint.rollback()
             return result
 
+        await savepoint.commit()
+        await self.db.commit()
+
         result["success"] = True
         logger.info(
             f"Rebilled operation {operation}: client charged ${client_cost}, "
@@ -445,12 +606,13 @@ class RebillingService:
         if markup > max_markup:
             raise ValueError(f"Maximum markup is {max_markup}x")
 
-        # Update features
-        features["rebilling_markup"] = markup
+        # Update features. Assign a new dict: the JSON column does not
+        # track in-place mutation, so mutating features would not persist.
+        features = {**features, "rebilling_markup": markup}
+        _markup_cache.pop(str(agency_id), None)
         agency.features = features
 
         await self.db.commit()
-        await self.db.refresh(agency)
 
         logger.info(f"Updated markup for agency {agency_id}: {markup}x")
         return {
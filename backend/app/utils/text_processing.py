@@ -5,16 +5,104 @@ Text Processing Utilities
 Provides text processing functions for document ingestion:
 - Token counting with tiktoken
 - Text normalization and cleaning
-- Language detection
+- Language detection (fastText when configured, else langdetect)
 - Sentence boundary detection
 """
 
+import functools
+import logging
 import re
 import unicodedata
 
 import tiktoken
 from langdetect import LangDetectException, detect
 
+from app.config import settings
+
+try:
+    # google-re2: linear-time DFA matching with the stdlib re API
+    import re2 as _scan_re
+except ImportError:
+    _scan_re = re
+
+logger = logging.getLogger(__name__)
+
+# Precompiled patterns (compiled once at import, not per call)
+_URL_RE = _scan_re.compile(r'https?://[^\s<>"\']+')
+_MULTISPACE_RE = re.compile(r'  +')
+_PARA_RE = re.compile(r'\n\n\n+')
+_CODEBLOCK_OPEN_RE = re.compile(r'```[\w]*\n')
+_CODEBLOCK_FENCE_RE = re.compile(r'```')
+_SENTENCE_END_RE = _scan_re.compile(r'[.!?]+[\s\n]+')
+
+
+class _ControlCharTable(dict):
+    """
+    str.translate table that deletes control characters (Unicode
+    category C*) except newlines and tabs.
+
+    Entries are filled in lazily on first sight of each codepoint, so
+    the table stays small while translate() runs in C for every
+    character it has already seen.
+    """
+
+    def __missing__(self, codepoint: int) -> int | None:
+        char = chr(codepoint)
+        if unicodedata.category(char)[0] == 'C' and char not in '\n\t':
+            value = None
+        else:
+            value = codepoint
+        self[codepoint] = value
+        return value
+
+
+_CTRL_TABLE = _ControlCharTable()
+
+
+@functools.lru_cache(maxsize=8)
+def _get_encoding(encoding_name: str) -> tiktoken.Encoding:
+    """Load a tiktoken encoding once per process (the BPE table is ~1 MB)."""
+    return tiktoken.get_encoding(encoding_name)
+
+
+def _chunk_starts(n_tokens: int, max_tokens: int, overlap_tokens: int) -> range:
+    """
+    Start offsets of token chunks for chunk_by_tokens.
+
+    Chunks start at a fixed stride of max_tokens - overlap_tokens (no
+    overlap if that is not positive), and the last chunk is the first
+    one that reaches n_tokens.
+    """
+    step = max_tokens - overlap_tokens
+    if step <= 0:
+        step = max_tokens
+    return range(0, n_tokens - max_tokens + step, step)
+
+
+# Optional fastText language ID model (lid.176.ftz). Used when the
+# `fasttext` package is installed and settings.FASTTEXT_LID_MODEL points at
+# the model file; otherwise detect_language falls back to langdetect.
+LID_MIN_CONFIDENCE = 0.5
+
+_lid_model = None
+
+
+def _get_lid_model():
+    """Load the fastText language ID model once; None if unavailable."""
+    global _lid_model
+    if _lid_model is None:
+        _lid_model = False
+        model_path = settings.FASTTEXT_LID_MODEL
+        if model_path:
+            try:
+                import fasttext
+                _lid_model = fasttext.load_model(model_path)
+            except ImportError:
+                logger.warning("FASTTEXT_LID_MODEL set but fasttext is not installed")
+            except ValueError as e:
+                logger.warning(f"Failed to load fastText model {model_path}: {e}")
+    return _lid_model or None
+
 
 class TextProcessor:
     """Utility class for text processing operations."""
@@ -26,10 +114,10 @@ class TextProcessor:
         Args:
             encoding_name: Tiktoken encoding to use (cl100k_base for GPT-4/3.5)
         """
-        self.encoding = tiktoken.get_encoding(encoding_name)
+        self.encoding = _get_encoding(encoding_name)
 
         # Sentence boundary patterns
-        self.sentence_endings = re.compile(r'[.!?]+[\s\n]+')
+        self.sentence_endings = _SENTENCE_END_RE
 
     def count_tokens(self, text: str) -> int:
         """
@@ -45,6 +133,20 @@ class TextProcessor:
             return 0
         return len(self.encoding.encode(text))
 
+    def count_tokens_batch(self, texts: list[str]) -> list[int]:
+        """
+        Count tokens for many texts in one tiktoken call.
+
+        Args:
+            texts: Texts to count tokens in
+
+        Returns:
+            Number of tokens per text, in input order
+        """
+        if not texts:
+            return []
+        return [len(tokens) for tokens in self.encoding.encode_batch(texts)]
+
     def normalize_text(self, text: str) -> str:
         """
         Normalize text for processing.
@@ -68,27 +170,28 @@ class TextProcessor:
         text = unicodedata.normalize('NFKC', text)
 
         # Remove control characters except newlines and tabs
-        text = ''.join(
-            char for char in text
-            if unicodedata.category(char)[0] != 'C' or char in '\n\t'
-        )
+        text = text.translate(_CTRL_TABLE)
 
         # Normalize whitespace while preserving paragraph breaks
-        # Replace multiple spaces with single space
-        text = re.sub(r' +', ' ', text)
-
-        # Preserve double newlines (paragraph breaks)
-        text = re.sub(r'\n\n+', '\n\n', text)
-
-        # Replace single newlines with spaces
-        text = re.sub(r'(?<!\n)\n(?!\n)', ' ', text)
-
-        # Replace tabs with spaces
-        text = text.replace('\t', ' ')
+        # Replace runs of spaces with a single space
+        text = _MULTISPACE_RE.sub(' ', text)
+
+        # Collapse 3+ newlines to a paragraph break
+        text = _PARA_RE.sub('\n\n', text)
+
+        # Replace single newlines and tabs with spaces. Newline runs are
+        # now exactly 1 or 2 long, so paragraph breaks are parked on a
+        # NUL sentinel (NUL was removed with the control characters).
+        text = (
+            text.replace('\n\n', '\x00')
+            .replace('\n', ' ')
+            .replace('\x00', '\n\n')
+            .replace('\t', ' ')
+        )
 
         # Trim whitespace from each line
-        lines = [line.strip() for line in text.split('\n')]
-        text = '\n'.join(lines)
+        if '\n' in text:
+            text = '\n'.join([line.strip() for line in text.split('\n')])
 
         return text.strip()
 
@@ -105,6 +208,14 @@ class TextProcessor:
         if not text or len(text.strip()) < 20:
             return None
 
+        lid_model = _get_lid_model()
+        if lid_model is not None:
+            # fastText predicts on a single line
+            labels, probs = lid_model.predict(text.replace('\n', ' '), k=1)
+            if probs[0] < LID_MIN_CONFIDENCE:
+                return None
+            return labels[0].removeprefix('__label__')
+
         try:
             return detect(text)
         except LangDetectException:
@@ -129,8 +240,8 @@ class TextProcessor:
         # Split on sentence boundaries
         sentences = self.sentence_endings.split(text)
 
-        # Filter empty sentences and strip whitespace
-        sentences = [s.strip() for s in sentences if s.strip()]
+        # Strip whitespace and filter empty sentences (one strip per item)
+        sentences = [s for s in map(str.strip, sentences) if s]
 
         return sentences
 
@@ -145,9 +256,7 @@ class TextProcessor:
             List of character positions where sentences end
         """
         boundaries = [0]  # Start of text
-
-        for match in self.sentence_endings.finditer(text):
-            boundaries.append(match.end())
+        boundaries.extend([match.end() for match in self.sentence_endings.finditer(text)])
 
         if boundaries[-1] != len(text):
             boundaries.append(len(text))  # End of text
@@ -179,30 +288,18 @@ class TextProcessor:
 
         # Encode text to tokens
         tokens = self.encoding.encode(text)
+        n_tokens = len(tokens)
 
-        if len(tokens) <= max_tokens:
+        if n_tokens <= max_tokens:
             return [text]
 
-        chunks = []
-        start = 0
-
-        while start < len(tokens):
-            # Get chunk of tokens
-            end = min(start + max_tokens, len(tokens))
-            chunk_tokens = tokens[start:end]
-
-            # Decode back to text
-            chunk_text = self.encoding.decode(chunk_tokens)
-            chunks.append(chunk_text)
-
-            # Move start position (with overlap)
-            start = end - overlap_tokens
+        slices = [
+            tokens[start:start + max_tokens]
+            for start in _chunk_starts(n_tokens, max_tokens, overlap_tokens)
+        ]
 
-            # Prevent infinite loop on small overlaps
-            if start <= end - max_tokens:
-                start = end
-
-        return chunks
+        # Decode all chunks in one call
+        return self.encoding.decode_batch(slices)
 
     def clean_code_blocks(self, text: str) -> str:
         """
@@ -215,8 +312,8 @@ class TextProcessor:
             Text with code blocks cleaned
         """
         # Remove code block markers but keep content
-        text = re.sub(r'```[\w]*\n', '\n', text)
-        text = re.sub(r'```', '', text)
+        text = _CODEBLOCK_OPEN_RE.sub('\n', text)
+        text = _CODEBLOCK_FENCE_RE.sub('', text)
 
         return text
 
@@ -230,10 +327,7 @@ class TextProcessor:
         Returns:
             List of URLs found
         """
-        url_pattern = re.compile(
-            r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-        )
-        return url_pattern.findall(text)
+        return _URL_RE.findall(text)
 
     def remove_urls(self, text: str) -> str:
         """
@@ -245,11 +339,40 @@ class TextProcessor:
         Returns:
             Text with URLs removed
         """
-        url_pattern = re.compile(
-            r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-        )
-        return url_pattern.sub('', text)
+        return _URL_RE.sub('', text)
 
 
 # Singleton instance for convenient access
 text_processor = TextProcessor()
+
+
+def count_tokens(text: str, encoding_name: str = "cl100k_base") -> int:
+    """
+    Count tokens in text without constructing a TextProcessor.
+
+    Args:
+        text: Text to count tokens in
+        encoding_name: Tiktoken encoding to use
+
+    Returns:
+        Number of tokens
+    """
+    if not text:
+        return 0
+    return len(_get_encoding(encoding_name).encode(text))
+
+
+def approx_count_tokens(text: str) -> int:
+    """
+    Estimate tokens from character count (~4 characters per token).
+
+    For thresholds and budgeting where an exact count is not needed;
+    no tokenizer call is made. Use count_tokens for exact counts.
+
+    Args:
+        text: Text to estimate tokens for
+
+    Returns:
+        Approximate number of tokens
+    """
+    return (len(text) + 3) // 4
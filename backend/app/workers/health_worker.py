@@ -3,10 +3,14 @@
 
 import asyncio
 import logging
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
 
 from app.config import settings
 from app.database import async_session_maker
+from app.models import Organization
 from app.services.health import AlertService, HealthScanner, HealthScorer
 
 logger = logging.getLogger(__name__)
@@ -23,6 +27,7 @@ class HealthWorker:
 
         # Worker configuration - uses settings or default 48h (2 days)
         self.scan_interval_hours = settings.HEALTH_SCAN_INTERVAL_HOURS
+        self.scan_concurrency = settings.HEALTH_SCAN_CONCURRENCY or 8
         self.is_running = False
         self.current_task: asyncio.Task | None = None
 
@@ -63,16 +68,21 @@ class HealthWorker:
 
         while self.is_running:
             try:
+                cycle_started = time.monotonic()
+                org_ids = await self._get_all_organization_ids()
+
                 # Run health scan for all organizations
-                await self._scan_all_organizations()
+                await self._scan_all_organizations(org_ids)
 
                 # Auto-maintenance tasks
                 await self._run_maintenance_tasks()
 
-                # Wait for next scan interval
-                scan_interval_seconds = self.scan_interval_hours * 3600
-                logger.info(f"Next health scan in {self.scan_interval_hours} hours")
-                await asyncio.sleep(scan_interval_seconds)
+                # Wait out the rest of the scan interval (the scan itself
+                # counts towards it)
+                elapsed = time.monotonic() - cycle_started
+                wait_seconds = max(0.0, self.scan_interval_hours * 3600 - elapsed)
+                logger.info(f"Next health scan in {wait_seconds / 3600:.1f} hours")
+                await asyncio.sleep(wait_seconds)
 
             except asyncio.CancelledError:
                 logger.info("Worker loop cancelled")
@@ -82,19 +92,20 @@ class HealthWorker:
                 # Wait a bit before retrying on error
                 await asyncio.sleep(300)  # 5 minutes
 
-    async def _scan_all_organizations(self):
-        """Run health scans for all organizations."""
+    async def _scan_all_organizations(self, org_ids: list[str] | None = None):
+        """Run health scans for all organizations (queried if not given)."""
         logger.info("Starting health scans for all organizations")
 
         try:
-            org_ids = await self._get_all_organization_ids()
+            if org_ids is None:
+                org_ids = await self._get_all_organization_ids()
 
-            for org_id in org_ids:
-                try:
-                    await self.scan_organization(org_id)
-                except Exception as e:
-                    logger.error(f"Error scanning org {org_id}: {e}", exc_info=True)
-                    # Continue with next org even if one fails
+            # Organizations are independent, so scan them concurrently up
+            # to the configured cap; one failure doesn't stop the others.
+            results = await self._gather_bounded(self.scan_organization, org_ids)
+            for org_id, result in zip(org_ids, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error scanning org {org_id}: {result}", exc_info=result)
 
             logger.info(f"Completed health scans for {len(org_ids)} organizations")
 
@@ -115,30 +126,33 @@ class HealthWorker:
         started_at = datetime.utcnow()
 
         try:
-            # Get database session
+            # Scan and scorer inputs run concurrently; they use separate
+            # sessions since one AsyncSession can't run queries in parallel.
             async with async_session_maker() as db:
-                # Run full scan using HealthScanner
-                scan_results = await self.health_scanner.scan_all(org_id, db)
-
-                # Get current alerts for health score calculation
-                alerts = await self.alert_service.get_alerts(org_id, status="active")
-
-                # Calculate health score
-                conflicts = [a for a in alerts if a.get("type") == "conflict"]
-                outdated = [a for a in alerts if a.get("type") == "outdated"]
-                gaps = [a for a in alerts if a.get("type") == "knowledge_gap"]
-
-                health_score = await self.health_scorer.calculate_health_score(
-                    org_id=org_id,
-                    conflicts=conflicts,
-                    outdated_docs=outdated,
-                    gaps=gaps,
-                    total_docs=50,  # TODO: Get from database
-                    total_queries=100,
-                    successful_queries=85,
-                    avg_doc_age_days=120.0
+                scan_results, inputs = await asyncio.gather(
+                    self.health_scanner.scan_all(org_id, db),
+                    self.health_scorer.get_org_stats(org_id),
                 )
 
+            # Get current alerts for health score calculation (after the
+            # scan, so alerts it just created are counted)
+            alerts = await self.alert_service.get_alerts(org_id, status="active")
+
+            # Calculate health score, grouping alerts by type in one pass
+            by_type: dict[str, list[dict]] = {"conflict": [], "outdated": [], "knowledge_gap": []}
+            for alert in alerts:
+                bucket = by_type.get(alert.get("type"))
+                if bucket is not None:
+                    bucket.append(alert)
+
+            health_score = await self.health_scorer.calculate_health_score(
+                org_id=org_id,
+                conflicts=by_type["conflict"],
+                outdated_docs=by_type["outdated"],
+                gaps=by_type["knowledge_gap"],
+                **inputs
+            )
+
             completed_at = datetime.utcnow()
             scan_duration = (completed_at - started_at).total_seconds()
 
@@ -174,32 +188,43 @@ class HealthWorker:
             }
 
     async def _run_maintenance_tasks(self):
-        """Run periodic maintenance tasks."""
+        """Run periodic maintenance tasks for all organizations at once."""
         logger.info("Running health system maintenance tasks")
 
         try:
-            org_ids = await self._get_all_organization_ids()
-
-            for org_id in org_ids:
-                try:
-                    # Auto-resolve stale alerts (30 days)
-                    resolved = await self.alert_service.auto_resolve_stale_alerts(org_id, days=30)
-                    if resolved > 0:
-                        logger.info(f"Auto-resolved {resolved} stale alerts for org {org_id}")
-
-                    # Clear old resolved alerts (90 days)
-                    cleared = await self.alert_service.clear_resolved_alerts(org_id, days=90)
-                    if cleared > 0:
-                        logger.info(f"Cleared {cleared} old alerts for org {org_id}")
+            now = datetime.utcnow()
+            # Auto-resolve stale alerts (30 days), clear old resolved alerts (90 days)
+            resolved, cleared = await asyncio.gather(
+                self.alert_service.auto_resolve_stale_alerts_bulk(now - timedelta(days=30)),
+                self.alert_service.clear_resolved_alerts_bulk(now - timedelta(days=90)),
+            )
 
-                except Exception as e:
-                    logger.error(f"Error in maintenance for org {org_id}: {e}", exc_info=True)
+            for org_id, count in resolved.items():
+                logger.info(f"Auto-resolved {count} stale alerts for org {org_id}")
+            for org_id, count in cleared.items():
+                logger.info(f"Cleared {count} old alerts for org {org_id}")
 
             logger.info("Maintenance tasks completed")
 
         except Exception as e:
             logger.error(f"Error running maintenance tasks: {e}", exc_info=True)
 
+    async def _gather_bounded(self, func, org_ids: list[str]) -> list:
+        """
+        Run func(org_id) for every organization, at most
+        HEALTH_SCAN_CONCURRENCY at a time.
+
+        Returns:
+            Results in org_ids order; exceptions are returned, not raised
+        """
+        semaphore = asyncio.Semaphore(self.scan_concurrency)
+
+        async def _run(org_id: str):
+            async with semaphore:
+                return await func(org_id)
+
+        return await asyncio.gather(*[_run(org_id) for org_id in org_ids], return_exceptions=True)
+
     async def _get_all_organization_ids(self) -> list[str]:
         """
         Get all organization IDs from database.
@@ -207,9 +232,9 @@ class HealthWorker:
         Returns:
             List of organization IDs
         """
-        # TODO: Implement database query to get real org IDs
-        # For now, return demo data
-        return ["org_demo_001"]
+        async with async_session_maker() as db:
+            result = await db.execute(select(Organization.organization_id))
+            return list(result.scalars().all())
 
     async def scan_on_demand(self, org_id: str) -> dict:
         """
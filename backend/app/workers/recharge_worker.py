@@ -0,0 +1,105 @@
+"""
+Recharge worker — runs wallet auto-recharges off the request path.
+
+WalletService.deduct enqueues an org when a debit leaves its balance at or
+below the recharge threshold, once the debit has committed; this worker
+performs the (Stripe) recharge in its own session so the AI request that
+triggered it does not wait on the payment provider. Debits that fail for
+lack of funds still recharge inline, since the caller needs that result.
+
+Single-process assumption, like inbox_poller: the queue lives in memory.
+A lost job is harmless — the next debit below threshold re-enqueues it.
+"""
+
+import asyncio
+import logging
+
+from app.database import async_session_maker
+
+logger = logging.getLogger(__name__)
+
+
+class RechargeWorker:
+    def __init__(self):
+        self.queue: asyncio.Queue[str] = asyncio.Queue()
+        self.pending: set[str] = set()
+        self.is_running = False
+        self.current_task: asyncio.Task | None = None
+
+    async def start(self):
+        if self.is_running:
+            logger.warning("Recharge worker already running")
+            return
+        self.is_running = True
+        logger.info("Starting recharge worker")
+        self.current_task = asyncio.create_task(self._run_loop())
+
+    async def stop(self):
+        if not self.is_running:
+            return
+        self.is_running = False
+        if self.current_task:
+            self.current_task.cancel()
+            try:
+                await self.current_task
+            except asyncio.CancelledError:
+                pass
+        logger.info("Recharge worker stopped")
+
+    def enqueue(self, org_id: str) -> None:
+        """Queue an org for recharge; no-op if it is already queued."""
+        if org_id in self.pending:
+            return
+        self.pending.add(org_id)
+        self.queue.put_nowait(org_id)
+
+    async def _run_loop(self):
+        while self.is_running:
+            try:
+                org_id = await self.queue.get()
+                self.pending.discard(org_id)
+                await self._recharge(org_id)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                # One failed recharge never kills the worker.
+                logger.error(f"recharge_worker: recharge failed: {e}")
+
+    async def _recharge(self, org_id: str):
+        from app.services.wallet_service import WalletService
+
+        async with async_session_maker() as db:
+            wallet_service = WalletService(db)
+            org = await wallet_service.get_organization(org_id)
+            if not org or not org.wallet_auto_recharge:
+                return
+            # _trigger_recharge re-checks the committed balance against the
+            # threshold, so duplicate or stale jobs are no-ops.
+            await wallet_service._trigger_recharge(org)
+
+
+_worker: RechargeWorker | None = None
+
+
+async def start_recharge_worker():
+    global _worker
+    _worker = RechargeWorker()
+    await _worker.start()
+
+
+async def stop_recharge_worker():
+    if _worker:
+        await _worker.stop()
+
+
+def enqueue_recharge(org_id: str) -> bool:
+    """
+    Queue a background recharge for an organization.
+
+    Returns False when the worker is not running (scripts, tests), in
+    which case the caller should recharge inline.
+    """
+    if not _worker or not _worker.is_running:
+        return False
+    _worker.enqueue(org_id)
+    return True
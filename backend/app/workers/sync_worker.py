@@ -9,15 +9,113 @@ Handles background document synchronization:
 """
 
 import asyncio
+import functools
 import logging
-from collections import deque
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Any
 
+import httpx
+from sqlalchemy import select
+
+from app.database import async_session_maker
+from app.models.oauth_connection import OAuthConnection
 from app.services.ingestion.pipeline import IngestionPipeline
 
 logger = logging.getLogger(__name__)
 
+# How long finished tasks stay queryable, and how often they are pruned
+COMPLETED_TASK_TTL = timedelta(hours=24)
+CLEANUP_INTERVAL_SECONDS = 3600
+
+# Per-source circuit breaker: after this many consecutive upstream failures
+# (see _is_upstream_failure), tasks for the source fail immediately for the
+# cooldown period
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_COOLDOWN_SECONDS = 60
+
+
+def _is_upstream_failure(exc: BaseException) -> bool:
+    """
+    Whether exc means the source itself is failing (5xx, timeout, network).
+
+    Only these count toward the source's circuit breaker; per-task errors
+    such as a missing or inactive connection must not block other tasks.
+    """
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500
+    return isinstance(exc, (httpx.TransportError, TimeoutError, ConnectionError))
+
+
+@functools.cache
+def _gmail_sync_service_cls():
+    """
+    Import GmailSyncService on first use.
+
+    Kept lazy because app.services.sync drops providers whose optional
+    dependencies are missing; importing it at module level would make
+    this worker unimportable in that case.
+    """
+    from app.services.sync.gmail_sync import GmailSyncService
+    return GmailSyncService
+
+
+class _ConnectionLoader:
+    """
+    Coalesces concurrent OAuthConnection lookups into batched IN queries.
+
+    Lookups arriving within BATCH_WINDOW_SECONDS of the first pending one
+    are loaded together (at most MAX_BATCH ids per query). Connections
+    come back detached; callers merge them into their own session.
+    """
+
+    BATCH_WINDOW_SECONDS = 0.005
+    MAX_BATCH = 50
+
+    def __init__(self):
+        self._pending: dict[str, list[asyncio.Future]] = {}
+        self._flush_task: asyncio.Task | None = None
+
+    async def load(self, connection_id: str) -> OAuthConnection | None:
+        """Load a connection by ID, batched with concurrent callers."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(connection_id, []).append(future)
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush())
+        return await future
+
+    async def _flush(self):
+        await asyncio.sleep(self.BATCH_WINDOW_SECONDS)
+        pending, self._pending = self._pending, {}
+        self._flush_task = None
+
+        ids = list(pending)
+        for i in range(0, len(ids), self.MAX_BATCH):
+            batch = ids[i:i + self.MAX_BATCH]
+            try:
+                async with async_session_maker() as db:
+                    result = await db.execute(
+                        select(OAuthConnection).where(
+                            OAuthConnection.connection_id.in_(batch)
+                        )
+                    )
+                    found = {conn.connection_id: conn for conn in result.scalars()}
+            except Exception as e:
+                for connection_id in batch:
+                    for future in pending[connection_id]:
+                        if not future.done():
+                            future.set_exception(e)
+                continue
+
+            for connection_id in batch:
+                for future in pending[connection_id]:
+                    if not future.done():
+                        future.set_result(found.get(connection_id))
+
+
+_connection_loader = _ConnectionLoader()
+
 
 class SyncTask:
     """Represents a sync task."""
@@ -37,6 +135,9 @@ class SyncTask:
         self.created_at = datetime.utcnow()
         self.started_at: datetime | None = None
         self.completed_at: datetime | None = None
+        # Monotonic clock readings for duration (immune to wall-clock jumps)
+        self._started_monotonic: float | None = None
+        self.duration_seconds: float | None = None
         self.error: str | None = None
         self.documents_synced = 0
         self.documents_failed = 0
@@ -51,6 +152,7 @@ class SyncTask:
             'created_at': self.created_at.isoformat(),
             'started_at': self.started_at.isoformat() if self.started_at else None,
             'completed_at': self.completed_at.isoformat() if self.completed_at else None,
+            'duration_seconds': self.duration_seconds,
             'documents_synced': self.documents_synced,
             'documents_failed': self.documents_failed,
             'error': self.error
@@ -70,11 +172,17 @@ class SyncWorker:
         """
         self.pipeline = pipeline
         self.max_concurrent = max_concurrent
-        self.task_queue: deque = deque()
+        self.task_queue: asyncio.Queue[SyncTask] = asyncio.Queue()
         self.active_tasks: dict[str, SyncTask] = {}
-        self.completed_tasks: dict[str, SyncTask] = {}
+        # Ordered by completion time, oldest first
+        self.completed_tasks: OrderedDict[str, SyncTask] = OrderedDict()
         self.running = False
-        self.worker_task: asyncio.Task | None = None
+        self._workers: list[asyncio.Task] = []
+        self._cleanup_handle: asyncio.TimerHandle | None = None
+        # Number of tasks currently in _process_task
+        self._active_processing = 0
+        # source -> (consecutive failures, monotonic time the circuit reopens)
+        self._breakers: dict[str, tuple[int, float]] = {}
 
     async def start(self):
         """Start the background worker."""
@@ -83,18 +191,25 @@ class SyncWorker:
             return
 
         self.running = True
-        self.worker_task = asyncio.create_task(self._worker_loop())
+        # One long-lived consumer per concurrency slot; each blocks on the
+        # queue, so tasks start as soon as they are queued
+        self._workers = [
+            asyncio.create_task(self._worker_loop())
+            for _ in range(self.max_concurrent)
+        ]
+        self._schedule_cleanup()
         logger.info("Sync worker started")
 
     async def stop(self):
         """Stop the background worker."""
         self.running = False
-        if self.worker_task:
-            self.worker_task.cancel()
-            try:
-                await self.worker_task
-            except asyncio.CancelledError:
-                pass
+        if self._cleanup_handle:
+            self._cleanup_handle.cancel()
+            self._cleanup_handle = None
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
         logger.info("Sync worker stopped")
 
     def queue_sync(
@@ -123,7 +238,7 @@ class SyncWorker:
             params=params
         )
 
-        self.task_queue.append(task)
+        self.task_queue.put_nowait(task)
         self.active_tasks[task_id] = task
 
         logger.info(f"Queued sync task {task_id} from {source}")
@@ -135,38 +250,37 @@ class SyncWorker:
         return task.to_dict() if task else None
 
     async def _worker_loop(self):
-        """Main worker loop."""
+        """Worker loop: process queued tasks one at a time."""
         logger.info("Worker loop started")
 
         while self.running:
+            task = await self.task_queue.get()
             try:
-                # Process tasks from queue
-                if self.task_queue:
-                    # Check if we have capacity
-                    active_count = sum(
-                        1 for task in self.active_tasks.values()
-                        if task.status == "processing"
-                    )
-
-                    if active_count < self.max_concurrent:
-                        task = self.task_queue.popleft()
-                        asyncio.create_task(self._process_task(task))
-
-                # Sleep before next check
-                await asyncio.sleep(1)
-
+                # _process_task records its own failures on the task
+                await self._process_task(task)
             except Exception as e:
                 logger.error(f"Error in worker loop: {e!s}", exc_info=True)
-                await asyncio.sleep(5)
+            finally:
+                self.task_queue.task_done()
 
     async def _process_task(self, task: SyncTask):
         """Process a sync task."""
         task.status = "processing"
         task.started_at = datetime.utcnow()
+        task._started_monotonic = time.monotonic()
+        self._active_processing += 1
 
         logger.info(f"Processing sync task {task.task_id} from {task.source}")
 
         try:
+            # Fail fast while the source's circuit is open
+            _fails, open_until = self._breakers.get(task.source, (0, 0.0))
+            if time.monotonic() < open_until:
+                task.status = "failed"
+                task.error = f"{task.source} circuit open after repeated failures"
+                logger.warning(f"Skipping sync task {task.task_id}: {task.error}")
+                return
+
             # Route to appropriate sync handler
             if task.source == "google-drive":
                 await self._sync_google_drive(task)
@@ -180,25 +294,42 @@ class SyncWorker:
                 raise ValueError(f"Unknown sync source: {task.source}")
 
             task.status = "completed"
+            self._breakers.pop(task.source, None)
             logger.info(
                 f"Completed sync task {task.task_id}: "
-                f"{task.documents_synced} synced, {task.documents_failed} failed"
+                f"{task.documents_synced} synced, {task.documents_failed} failed "
+                f"in {time.monotonic() - task._started_monotonic:.1f}s"
             )
 
         except Exception as e:
             task.status = "failed"
             task.error = str(e)
             logger.error(f"Error processing sync task {task.task_id}: {e!s}", exc_info=True)
+            if _is_upstream_failure(e):
+                self._record_source_failure(task.source)
 
         finally:
+            self._active_processing -= 1
+            task.duration_seconds = time.monotonic() - task._started_monotonic
             task.completed_at = datetime.utcnow()
 
-            # Move to completed
+            # Move to completed (appended, so the dict stays in completion order)
             self.completed_tasks[task.task_id] = task
+            self.completed_tasks.move_to_end(task.task_id)
             del self.active_tasks[task.task_id]
 
-            # Clean old completed tasks (keep for 24 hours)
-            self._clean_completed_tasks()
+    def _record_source_failure(self, source: str):
+        """Count a failure for source and open its circuit at the threshold."""
+        fails, open_until = self._breakers.get(source, (0, 0.0))
+        fails += 1
+        if fails >= BREAKER_FAILURE_THRESHOLD:
+            open_until = time.monotonic() + BREAKER_COOLDOWN_SECONDS
+            fails = 0
+            logger.warning(
+                f"Opening circuit for {source} for {BREAKER_COOLDOWN_SECONDS}s "
+                f"after {BREAKER_FAILURE_THRESHOLD} consecutive failures"
+            )
+        self._breakers[source] = (fails, open_until)
 
     async def _sync_google_drive(self, task: SyncTask):
         """
@@ -231,12 +362,6 @@ class SyncWorker:
         Args:
             task: Sync task containing connection_id and sync options
         """
-        from sqlalchemy import select
-
-        from app.database import async_session_maker
-        from app.models.oauth_connection import OAuthConnection
-        from app.services.sync import GmailSyncService
-
         connection_id = task.params.get('connection_id')
         max_emails = task.params.get('max_emails', 500)
         include_attachments = task.params.get('include_attachments', True)
@@ -246,22 +371,21 @@ class SyncWorker:
             raise ValueError("No connection_id provided for Gmail sync")
 
         try:
-            async with async_session_maker() as db:
-                # Get the OAuth connection
-                query = select(OAuthConnection).where(
-                    OAuthConnection.connection_id == connection_id
-                )
-                result = await db.execute(query)
-                connection = result.scalar_one_or_none()
+            # Get the OAuth connection (batched with concurrent syncs)
+            connection = await _connection_loader.load(connection_id)
 
-                if not connection:
-                    raise ValueError(f"Connection {connection_id} not found")
+            if not connection:
+                raise ValueError(f"Connection {connection_id} not found")
 
-                if connection.status != "active":
-                    raise ValueError(f"Connection {connection_id} is not active")
+            if connection.status != "active":
+                raise ValueError(f"Connection {connection_id} is not active")
+
+            async with async_session_maker() as db:
+                # Attach to this session without re-selecting it
+                connection = await db.merge(connection, load=False)
 
                 # Run the sync
-                sync_service = GmailSyncService()
+                sync_service = _gmail_sync_service_cls()()
                 results = await sync_service.sync_connection(
                     connection=connection,
                     db=db,
@@ -307,32 +431,44 @@ class SyncWorker:
         # Placeholder for actual implementation
         task.documents_synced = 1
 
-    def _clean_completed_tasks(self):
-        """Remove completed tasks older than 24 hours."""
-        cutoff = datetime.utcnow() - timedelta(hours=24)
+    def _schedule_cleanup(self):
+        """Run _clean_completed_tasks every CLEANUP_INTERVAL_SECONDS while running."""
+        self._cleanup_handle = asyncio.get_running_loop().call_later(
+            CLEANUP_INTERVAL_SECONDS, self._periodic_cleanup
+        )
 
-        to_remove = [
-            task_id for task_id, task in self.completed_tasks.items()
-            if task.completed_at and task.completed_at < cutoff
-        ]
+    def _periodic_cleanup(self):
+        """Timer callback: clean, then re-arm the timer."""
+        if not self.running:
+            return
+        try:
+            self._clean_completed_tasks()
+        except Exception as e:
+            logger.error(f"Error cleaning completed tasks: {e!s}", exc_info=True)
+        self._schedule_cleanup()
 
-        for task_id in to_remove:
-            del self.completed_tasks[task_id]
+    def _clean_completed_tasks(self):
+        """Remove completed tasks older than COMPLETED_TASK_TTL."""
+        cutoff = datetime.utcnow() - COMPLETED_TASK_TTL
+
+        # Oldest tasks are at the front, so stop at the first one to keep
+        removed = 0
+        while self.completed_tasks:
+            task = next(iter(self.completed_tasks.values()))
+            if task.completed_at and task.completed_at >= cutoff:
+                break
+            self.completed_tasks.popitem(last=False)
+            removed += 1
 
-        if to_remove:
-            logger.info(f"Cleaned {len(to_remove)} old completed tasks")
+        if removed:
+            logger.info(f"Cleaned {removed} old completed tasks")
 
     def get_stats(self) -> dict[str, Any]:
         """Get worker statistics."""
-        active_count = sum(
-            1 for task in self.active_tasks.values()
-            if task.status == "processing"
-        )
-
         return {
             'running': self.running,
-            'queued': len(self.task_queue),
-            'active': active_count,
+            'queued': self.task_queue.qsize(),
+            'active': self._active_processing,
             'completed': len(self.completed_tasks),
             'max_concurrent': self.max_concurrent
         }
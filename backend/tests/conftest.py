@@ -9,6 +9,9 @@ This module provides:
 """
 
 import asyncio
+import hmac
+import os
+import sys
 from collections.abc import AsyncGenerator, Generator
 from datetime import datetime, timedelta
 from typing import Any
@@ -19,15 +22,76 @@ import pytest
 import pytest_asyncio
 from fastapi.testclient import TestClient
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
+# Test database URL (SQLite in-memory for speed). Set before the app is
+# imported so its own engine (used at startup) never touches a file either.
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+
 from app.database import Base, get_db
 from app.main import app
 from app.models.user import User
-from app.services.auth_service import hash_password, create_access_token
+from app.services import auth_service
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "real_bcrypt: hash and verify passwords with real bcrypt"
+    )
+
+
+# ============================================================================
+# Password Hashing
+# ============================================================================
+
+# bcrypt is deliberately slow and tests only need "some hash that verifies",
+# so the app hashes with a cheap stand-in for the session. It keeps bcrypt's
+# "$2b$" prefix so prefix checks still hold.
+_real_hash_password = auth_service.hash_password
+_real_verify_password = auth_service.verify_password
+
+_PLAIN_HASH_PREFIX = "$2b$04$stub"
+
+# Modules that bind hash_password / verify_password at import time
+_BCRYPT_PATCH_TARGETS = ("app.services.auth_service", "app.routers.auth")
+
+
+def _plain_hash_password(password: str) -> str:
+    return _PLAIN_HASH_PREFIX + password
+
+
+def _plain_verify_password(plain_password: str, hashed_password: str) -> bool:
+    # Hashes made with real bcrypt (e.g. by tests importing hash_password
+    # directly) still verify the real way
+    if not hashed_password.startswith(_PLAIN_HASH_PREFIX):
+        return _real_verify_password(plain_password, hashed_password)
+    return hmac.compare_digest(
+        hashed_password.encode("utf-8"),
+        _plain_hash_password(plain_password).encode("utf-8"),
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def plain_hasher():
+    """Replace bcrypt in hash_password / verify_password for the whole session."""
+    with pytest.MonkeyPatch.context() as mp:
+        for module in _BCRYPT_PATCH_TARGETS:
+            mp.setattr(f"{module}.hash_password", _plain_hash_password)
+            mp.setattr(f"{module}.verify_password", _plain_verify_password)
+        yield
+
+
+@pytest.fixture(autouse=True)
+def _real_bcrypt_for_marked_tests(request, monkeypatch):
+    """Restore real bcrypt for tests marked real_bcrypt (e.g. salt checks)."""
+    if request.node.get_closest_marker("real_bcrypt"):
+        for module in _BCRYPT_PATCH_TARGETS:
+            monkeypatch.setattr(f"{module}.hash_password", _real_hash_password)
+            monkeypatch.setattr(f"{module}.verify_password", _real_verify_password)
 
 
 # ============================================================================
@@ -35,54 +99,80 @@ from app.services.auth_service import hash_password, create_access_token
 # ============================================================================
 
 @pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
-    """Create an event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """
+    Run async tests on uvloop, as uvicorn[standard] does in production.
+
+    Falls back to the default asyncio loop on Windows or when uvloop is
+    not installed.
+    """
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            return uvloop.EventLoopPolicy()
+        except ImportError:
+            pass
+    return asyncio.DefaultEventLoopPolicy()
 
 
 # ============================================================================
 # Database Fixtures
 # ============================================================================
 
-# Test database URL (SQLite in-memory for speed)
-TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
-
-
-@pytest_asyncio.fixture(scope="function")
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def async_engine():
-    """Create async test database engine."""
+    """
+    Create the async test database engine once per test session.
+
+    The schema is created once; db_session isolates each test in a
+    transaction that is rolled back. The in-memory database goes away
+    with the process, so there is no drop_all teardown.
+    """
     engine = create_async_engine(
         TEST_DATABASE_URL,
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
         echo=False,
     )
-    
+
+    # pysqlite's own transaction handling breaks SAVEPOINT; let
+    # SQLAlchemy emit BEGIN itself.
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-    
+
     yield engine
-    
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-    
+
     await engine.dispose()
 
 
 @pytest_asyncio.fixture(scope="function")
 async def db_session(async_engine) -> AsyncGenerator[AsyncSession, None]:
-    """Create a test database session."""
-    async_session_maker = async_sessionmaker(
-        async_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
-    
-    async with async_session_maker() as session:
-        yield session
-        await session.rollback()
+    """
+    Create a test database session inside a rolled-back transaction.
+
+    Commits made by the test or the app become SAVEPOINT releases, so
+    nothing outlives the test.
+    """
+    async with async_engine.connect() as conn:
+        await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await conn.rollback()
 
 
 @pytest_asyncio.fixture(scope="function")
@@ -100,40 +190,56 @@ async def override_get_db(db_session: AsyncSession):
 # HTTP Client Fixtures
 # ============================================================================
 
-@pytest.fixture(scope="function")
-def client(override_get_db) -> Generator[TestClient, None, None]:
-    """Create a synchronous test client."""
+@pytest.fixture(scope="session")
+def _session_client() -> Generator[TestClient, None, None]:
+    """One TestClient (and one app startup/shutdown) for the whole session."""
     with TestClient(app) as test_client:
         yield test_client
 
 
-@pytest_asyncio.fixture(scope="function")
-async def async_client(override_get_db) -> AsyncGenerator[AsyncClient, None]:
-    """Create an async test client."""
+@pytest.fixture(scope="function")
+def client(override_get_db, _session_client: TestClient) -> TestClient:
+    """Synchronous test client bound to this test's database session."""
+    # Cookies set by one test (e.g. login) must not authenticate the next
+    _session_client.cookies.clear()
+    return _session_client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _session_async_client() -> AsyncGenerator[AsyncClient, None]:
+    """One in-process ASGI client (no TestClient thread portal) for the whole session."""
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
 
 
+@pytest.fixture(scope="function")
+def async_client(override_get_db, _session_async_client: AsyncClient) -> AsyncClient:
+    """Async test client bound to this test's database session."""
+    _session_async_client.cookies.clear()
+    return _session_async_client
+
+
 # ============================================================================
 # Authentication Fixtures
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_user_data() -> dict[str, Any]:
-    """Standard test user data."""
+    """Standard test user data (shared by the session; do not mutate)."""
     return {
         "email": "test@example.com",
         "password": "SecurePassword123!",
         "name": "Test User",
+        "user_id": str(uuid4()),
         "organization_id": str(uuid4()),
         "organization_domain": "example.com",
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_admin_data() -> dict[str, Any]:
-    """Test admin user data."""
+    """Test admin user data (shared by the session; do not mutate)."""
     return {
         "email": "admin@example.com",
         "password": "AdminPassword123!",
@@ -150,7 +256,7 @@ async def test_user(db_session: AsyncSession, test_user_data: dict) -> User:
     from app.services.auth_service import hash_password
 
     user = User(
-        user_id=str(uuid4()),
+        user_id=test_user_data["user_id"],
         email=test_user_data["email"],
         hashed_password=hash_password(test_user_data["password"]),
         name=test_user_data["name"],
@@ -160,13 +266,14 @@ async def test_user(db_session: AsyncSession, test_user_data: dict) -> User:
     )
     db_session.add(user)
     await db_session.commit()
-    await db_session.refresh(user)
+    # No refresh: every column is set here or by a client-side default,
+    # and expire_on_commit=False keeps them loaded.
     return user
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def auth_headers(test_user_data: dict) -> dict[str, str]:
-    """Generate auth headers with a valid JWT token."""
+    """Generate auth headers with a valid JWT token (signed once per session)."""
     from uuid import UUID
     from app.services.auth_service import create_access_token
 
@@ -175,13 +282,30 @@ def auth_headers(test_user_data: dict) -> dict[str, str]:
         email=test_user_data["email"],
         organization_id=UUID(test_user_data["organization_id"]),
         role="user",
+        expires_delta=timedelta(hours=24),  # outlives the test session
     )
     return {"Authorization": f"Bearer {token}"}
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def test_user_auth_headers(test_user_data: dict) -> dict[str, str]:
+    """Auth headers for the test_user row (signed once per session)."""
+    from uuid import UUID
+    from app.services.auth_service import create_access_token
+
+    token = create_access_token(
+        user_id=UUID(test_user_data["user_id"]),
+        email=test_user_data["email"],
+        organization_id=UUID(test_user_data["organization_id"]),
+        role="user",
+        expires_delta=timedelta(hours=24),  # outlives the test session
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture(scope="session")
 def admin_auth_headers(test_admin_data: dict) -> dict[str, str]:
-    """Generate auth headers for admin user."""
+    """Generate auth headers for admin user (signed once per session)."""
     from uuid import UUID
     from app.services.auth_service import create_access_token
 
@@ -190,6 +314,7 @@ def admin_auth_headers(test_admin_data: dict) -> dict[str, str]:
         email=test_admin_data["email"],
         organization_id=UUID(test_admin_data["organization_id"]),
         role="admin",
+        expires_delta=timedelta(hours=24),  # outlives the test session
     )
     return {"Authorization": f"Bearer {token}"}
 
@@ -313,6 +438,10 @@ def mock_redis():
 # Utility Fixtures
 # ============================================================================
 
+# Fixed timestamp for sample data, so serialized values are deterministic
+_NOW_ISO = "2024-01-01T00:00:00"
+
+
 @pytest.fixture
 def sample_document() -> dict[str, Any]:
     """Sample document data for testing."""
@@ -322,7 +451,7 @@ def sample_document() -> dict[str, Any]:
         "source": "test",
         "metadata": {
             "author": "Test Author",
-            "created_at": datetime.utcnow().isoformat(),
+            "created_at": _NOW_ISO,
         },
     }
 
@@ -342,7 +471,7 @@ def sample_decision() -> dict[str, Any]:
         "title": "Test Decision",
         "description": "A test decision for the decision archaeology feature.",
         "category": "strategic",
-        "decision_date": datetime.utcnow().isoformat(),
+        "decision_date": _NOW_ISO,
         "context": {
             "background": "Test background",
             "stakeholders": ["Test User"],
@@ -15,7 +15,6 @@ Covers:
 from datetime import datetime
 from uuid import uuid4
 
-import pytest
 import pytest_asyncio
 from fastapi import status
 from sqlalchemy import select
@@ -121,7 +120,6 @@ async def _seed_signal(
 class TestAdminPurgeAuthorization:
     """Only admin/superadmin users may call POST /admin/purge."""
 
-    @pytest.mark.asyncio
     async def test_non_admin_user_gets_403(self, async_client, db_session):
         org_id = str(uuid4())
         user = await _seed_regular_user(db_session, org_id)
@@ -152,7 +150,6 @@ class TestAdminPurgeBehavior:
         admin = await _seed_admin_user(db_session, org_id)
         return org_id, admin
 
-    @pytest.mark.asyncio
     async def test_purge_returns_purged_count_and_tombstone_id(
         self, async_client, db_session, org_and_admin
     ):
@@ -171,7 +168,6 @@ class TestAdminPurgeBehavior:
         assert "tombstone_id" in data
         assert data["purged_count"] >= 1
 
-    @pytest.mark.asyncio
     async def test_purge_soft_deletes_signals_by_contact_match_key(
         self, async_client, db_session, org_and_admin
     ):
@@ -188,7 +184,6 @@ class TestAdminPurgeBehavior:
         await db_session.refresh(signal)
         assert signal.deleted_at is not None
 
-    @pytest.mark.asyncio
     async def test_purge_inserts_tombstone_of_type_email_hash(
         self, async_client, db_session, org_and_admin
     ):
@@ -209,7 +204,6 @@ class TestAdminPurgeBehavior:
         assert tombstone.tombstone_type == "email_hash"
         assert tombstone.email_hash == VALID_HASH
 
-    @pytest.mark.asyncio
     async def test_purge_idempotent_does_not_double_soft_delete(
         self, async_client, db_session, org_and_admin
     ):
@@ -233,7 +227,6 @@ class TestAdminPurgeBehavior:
         # Second call should purge 0 additional signals
         assert r2.json()["purged_count"] == 0
 
-    @pytest.mark.asyncio
     async def test_purge_via_email_alias_contact_id(
         self, async_client, db_session, org_and_admin
     ):
@@ -284,7 +277,6 @@ class TestAdminPurgeBehavior:
         await db_session.refresh(signal)
         assert signal.deleted_at is not None
 
-    @pytest.mark.asyncio
     async def test_purge_does_not_affect_other_org_signals(
         self, async_client, db_session, org_and_admin
     ):
@@ -304,7 +296,6 @@ class TestAdminPurgeBehavior:
         await db_session.refresh(other_signal)
         assert other_signal.deleted_at is None
 
-    @pytest.mark.asyncio
     async def test_purge_email_hash_must_be_64_chars(
         self, async_client, db_session, org_and_admin
     ):
@@ -318,7 +309,6 @@ class TestAdminPurgeBehavior:
         )
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
-    @pytest.mark.asyncio
     async def test_purge_reason_stored_on_tombstone(
         self, async_client, db_session, org_and_admin
     ):
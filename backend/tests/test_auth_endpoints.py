@@ -10,9 +10,18 @@ Tests cover:
 - Password reset flow
 """
 
+import asyncio
+
 import pytest
 from fastapi import status
 
+from app.database import get_db
+from app.main import app
+from app.services.auth_service import create_refresh_token
+
+# Well-formed (minimum-length) reset token that matches no real token
+_DUMMY_TOKEN = "a" * 32
+
 
 class TestUserRegistration:
     """Tests for POST /auth/register endpoint."""
@@ -36,31 +45,36 @@ class TestUserRegistration:
         assert data["user"]["email"] == "newuser@example.com"
         assert "hashed_password" not in str(data)  # Should not expose password
 
-    def test_register_invalid_email(self, client):
-        """Test registration with invalid email format."""
-        response = client.post(
-            "/auth/register",
-            json={
-                "email": "not-an-email",
-                "password": "SecurePassword123!",
-                "name": "Test User",
-                "organization_domain": "example.com",
-            },
-        )
-
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
-    def test_register_weak_password(self, client):
-        """Test registration with weak password."""
-        response = client.post(
-            "/auth/register",
-            json={
-                "email": "test@example.com",
-                "password": "weak",
-                "name": "Test User",
-                "organization_domain": "example.com",
-            },
-        )
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            pytest.param(
+                {
+                    "email": "not-an-email",
+                    "password": "SecurePassword123!",
+                    "name": "Test User",
+                    "organization_domain": "example.com",
+                },
+                id="invalid_email",
+            ),
+            pytest.param(
+                {
+                    "email": "test@example.com",
+                    "password": "weak",
+                    "name": "Test User",
+                    "organization_domain": "example.com",
+                },
+                id="weak_password",
+            ),
+            pytest.param(
+                {"email": "test@example.com"},  # Missing password and name
+                id="missing_fields",
+            ),
+        ],
+    )
+    def test_register_validation_error(self, client, payload):
+        """Test registration rejects invalid payloads."""
+        response = client.post("/auth/register", json=payload)
 
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
@@ -78,24 +92,13 @@ class TestUserRegistration:
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-    def test_register_missing_fields(self, client):
-        """Test registration with missing required fields."""
-        response = client.post(
-            "/auth/register",
-            json={
-                "email": "test@example.com",
-                # Missing password and name
-            },
-        )
-        
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
 
 class TestUserLogin:
     """Tests for POST /auth/login endpoint."""
 
     def test_login_success(self, client, test_user, test_user_data):
         """Test successful login."""
+        # No CSRF token is sent: login must not require one
         response = client.post(
             "/auth/login",
             json={
@@ -112,66 +115,47 @@ class TestUserLogin:
         cookies = response.cookies
         assert "access_token" in cookies or len(cookies) > 0
 
-    def test_login_invalid_email(self, client):
-        """Test login with non-existent email."""
+    @pytest.mark.parametrize(
+        "email,password,expected",
+        [
+            pytest.param(
+                "nonexistent@example.com",
+                "SomePassword123!",
+                [status.HTTP_401_UNAUTHORIZED, status.HTTP_404_NOT_FOUND],
+                id="invalid_email",
+            ),
+            pytest.param(
+                "test@example.com",
+                "WrongPassword123!",
+                [status.HTTP_401_UNAUTHORIZED],
+                id="wrong_password",
+            ),
+            # User model has no is_active field; an inactive user is
+            # simulated with completely wrong credentials
+            pytest.param(
+                "test@example.com",
+                "CompletelyWrongPassword123!",
+                [status.HTTP_401_UNAUTHORIZED],
+                id="inactive_user",
+            ),
+        ],
+    )
+    def test_login_rejected(self, client, test_user, email, password, expected):
+        """Test login fails for unknown emails and wrong passwords."""
         response = client.post(
             "/auth/login",
-            json={
-                "email": "nonexistent@example.com",
-                "password": "SomePassword123!",
-            },
+            json={"email": email, "password": password},
         )
-        
-        assert response.status_code in [
-            status.HTTP_401_UNAUTHORIZED,
-            status.HTTP_404_NOT_FOUND,
-        ]
 
-    def test_login_wrong_password(self, client, test_user, test_user_data):
-        """Test login with incorrect password."""
-        response = client.post(
-            "/auth/login",
-            json={
-                "email": test_user_data["email"],
-                "password": "WrongPassword123!",
-            },
-        )
-        
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
-    def test_login_inactive_user(self, client, test_user):
-        """Test login with incorrect credentials (simulates inactive user behavior)."""
-        # Note: User model doesn't have is_active field
-        # Instead test that wrong credentials are rejected
-        response = client.post(
-            "/auth/login",
-            json={
-                "email": test_user.email,
-                "password": "CompletelyWrongPassword123!",
-            },
-        )
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.status_code in expected
 
 
 class TestGetCurrentUser:
     """Tests for GET /auth/me endpoint."""
 
-    def test_get_current_user_success(self, client, test_user):
+    def test_get_current_user_success(self, client, test_user, test_user_auth_headers):
         """Test getting current user with valid token."""
-        from uuid import UUID
-        from app.services.auth_service import create_access_token
-
-        # Create token using actual test_user's user_id
-        token = create_access_token(
-            user_id=UUID(test_user.user_id),
-            email=test_user.email,
-            organization_id=UUID(test_user.organization_id),
-            role=test_user.role,
-        )
-        headers = {"Authorization": f"Bearer {token}"}
-
-        response = client.get("/auth/me", headers=headers)
+        response = client.get("/auth/me", headers=test_user_auth_headers)
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
@@ -210,23 +194,13 @@ class TestTokenRefresh:
 
     def test_refresh_token_success(self, client, test_user):
         """Test successful token refresh."""
-        # First login to get tokens
-        login_response = client.post(
-            "/auth/login",
-            json={
-                "email": test_user.email,
-                "password": "SecurePassword123!",
-            },
-        )
-        
-        # Then try to refresh
+        # Issue the refresh token directly rather than logging in for it
+        client.cookies.set("refresh_token", create_refresh_token(user_id=test_user.user_id))
+
         response = client.post("/auth/refresh")
-        
-        # Should either succeed or indicate no refresh token
-        assert response.status_code in [
-            status.HTTP_200_OK,
-            status.HTTP_401_UNAUTHORIZED,  # If refresh token not in cookie
-        ]
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["user"]["email"] == test_user.email
 
     def test_refresh_token_no_cookie(self, client):
         """Test refresh without refresh token cookie."""
@@ -238,21 +212,9 @@ class TestTokenRefresh:
 class TestLogout:
     """Tests for POST /auth/logout endpoint."""
 
-    def test_logout_success(self, client, test_user):
+    def test_logout_success(self, client, test_user, test_user_auth_headers):
         """Test successful logout."""
-        from uuid import UUID
-        from app.services.auth_service import create_access_token
-
-        # Create token using actual test_user's user_id
-        token = create_access_token(
-            user_id=UUID(test_user.user_id),
-            email=test_user.email,
-            organization_id=UUID(test_user.organization_id),
-            role=test_user.role,
-        )
-        headers = {"Authorization": f"Bearer {token}"}
-
-        response = client.post("/auth/logout", headers=headers)
+        response = client.post("/auth/logout", headers=test_user_auth_headers)
 
         assert response.status_code == status.HTTP_200_OK
 
@@ -299,7 +261,7 @@ class TestPasswordReset:
         response = client.post(
             "/auth/reset-password",
             json={
-                "token": "a" * 32,  # Invalid token
+                "token": _DUMMY_TOKEN,
                 "new_password": "NewSecurePassword123!",
             },
         )
@@ -313,48 +275,34 @@ class TestPasswordReset:
 class TestRateLimiting:
     """Tests for authentication rate limiting."""
 
-    def test_login_rate_limiting(self, client):
+    async def test_login_rate_limiting(self, async_client, db_session):
         """Test that login endpoint has rate limiting."""
-        # Make many rapid requests
-        responses = []
-        for _ in range(20):
-            response = client.post(
+        # The requests share this test's session, which can't run queries
+        # concurrently, so they take turns on it; the rest overlaps
+        session_lock = asyncio.Lock()
+
+        async def _locked_get_db():
+            async with session_lock:
+                yield db_session
+
+        app.dependency_overrides[get_db] = _locked_get_db
+
+        # Fire the requests concurrently, as a burst of attempts would arrive
+        responses = await asyncio.gather(*[
+            async_client.post(
                 "/auth/login",
                 json={
                     "email": "test@example.com",
                     "password": "password",
                 },
             )
-            responses.append(response.status_code)
-        
+            for _ in range(20)
+        ])
+
         # At least some should be rate limited (429)
         # Or all fail with 401 (which is also acceptable)
         assert all(
-            code in [status.HTTP_401_UNAUTHORIZED, status.HTTP_429_TOO_MANY_REQUESTS]
-            for code in responses
-        )
-
-
-class TestCSRFProtection:
-    """Tests for CSRF protection on auth endpoints."""
-
-    def test_login_without_csrf_token(self, client, test_user, test_user_data):
-        """Test that state-changing requests work without explicit CSRF for cookie-based auth."""
-        # The CSRF token is typically set by the server and sent with requests
-        # This test verifies the endpoint is accessible
-        response = client.post(
-            "/auth/login",
-            json={
-                "email": test_user_data["email"],
-                "password": test_user_data["password"],
-            },
+            response.status_code
+            in [status.HTTP_401_UNAUTHORIZED, status.HTTP_429_TOO_MANY_REQUESTS]
+            for response in responses
         )
-
-        # Should either succeed or fail for auth reasons (not CSRF)
-        # Note: 429 is acceptable if rate limited by previous tests
-        assert response.status_code in [
-            status.HTTP_200_OK,
-            status.HTTP_401_UNAUTHORIZED,
-            status.HTTP_404_NOT_FOUND,
-            status.HTTP_429_TOO_MANY_REQUESTS,
-        ]
@@ -0,0 +1,37 @@
+"""
+Tests for DocumentChunker overlap sizing.
+
+Tests cover:
+- Overlap is sized with approx_count_tokens, without the tokenizer
+- Sentence overlap stays within overlap_tokens
+"""
+
+import pytest
+
+from app.services.ingestion.chunker import DocumentChunker
+from app.utils.text_processing import text_processor
+
+
+@pytest.fixture
+def chunker(monkeypatch):
+    """Chunker with a 10-token overlap; exact token counting is forbidden."""
+    def _no_tokenizer(text):
+        raise AssertionError("overlap sizing should not tokenize")
+
+    monkeypatch.setattr(text_processor, "count_tokens", _no_tokenizer)
+    return DocumentChunker(max_tokens=100, overlap_tokens=10, min_chunk_tokens=1)
+
+
+class TestOverlap:
+    """Tests for _get_overlap_text and _get_sentence_overlap."""
+
+    def test_short_paragraph_is_whole_overlap(self, chunker):
+        """Test a paragraph within the estimated budget is reused whole."""
+        assert chunker._get_overlap_text(["first", "x" * 40]) == "x" * 40
+
+    def test_sentence_overlap_fits_budget(self, chunker):
+        """Test trailing sentences are kept until the estimate exceeds the budget."""
+        # Estimated at 10, 5 and 4 tokens (~4 characters per token)
+        sentences = ["a" * 40, "b" * 20, "c" * 16]
+
+        assert chunker._get_sentence_overlap(sentences) == f"{'b' * 20} {'c' * 16}"
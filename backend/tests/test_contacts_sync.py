@@ -13,7 +13,6 @@ Critical claims:
 from datetime import datetime, timedelta
 from uuid import uuid4
 
-import pytest
 import pytest_asyncio
 from fastapi import status
 from sqlalchemy import select
@@ -57,7 +56,6 @@ def _daemon_headers(cred) -> dict:
 class TestServerSideHashing:
     """Email must be hashed server-side; raw email must never appear in the response."""
 
-    @pytest.mark.asyncio
     async def test_response_contains_email_hash_not_raw_email(
         self, async_client, db_session, daemon_credential
     ):
@@ -81,7 +79,6 @@ class TestServerSideHashing:
         expected_hash = email_hash(raw_email)
         assert expected_hash in raw_str
 
-    @pytest.mark.asyncio
     async def test_aliased_email_hashes_match_normalized_form(
         self, async_client, db_session, daemon_credential
     ):
@@ -101,7 +98,6 @@ class TestServerSideHashing:
         expected_hash = email_hash(raw_email)  # normalises jane+sales@acme.com -> jane@acme.com
         assert row["email_hash"] == expected_hash
 
-    @pytest.mark.asyncio
     async def test_email_and_email_display_fields_absent_for_daemon(
         self, async_client, db_session, daemon_credential
     ):
@@ -137,7 +133,6 @@ class TestCursorPagination:
             contacts.append(c)
         return cred, contacts
 
-    @pytest.mark.asyncio
     async def test_first_page_returns_oldest_two(self, async_client, five_contacts):
         cred, contacts = five_contacts
         response = await async_client.get(
@@ -151,7 +146,6 @@ class TestCursorPagination:
         assert contacts[0].id in returned_ids
         assert contacts[1].id in returned_ids
 
-    @pytest.mark.asyncio
     async def test_second_page_uses_next_since_cursor(self, async_client, five_contacts):
         """Page 2 must contain contacts that were NOT on page 1 (excluding the
         boundary contact which the inclusive >= cursor may repeat).
@@ -184,7 +178,6 @@ class TestCursorPagination:
         new_on_p2 = ids_p2 - ids_p1
         assert len(new_on_p2) >= 1
 
-    @pytest.mark.asyncio
     async def test_last_page_has_no_next_since(self, async_client, five_contacts):
         """When returned rows < limit, next_since must be None."""
         cred, _ = five_contacts
@@ -194,7 +187,6 @@ class TestCursorPagination:
         assert response.status_code == status.HTTP_200_OK
         assert response.json()["next_since"] is None
 
-    @pytest.mark.asyncio
     async def test_empty_org_returns_empty_list(self, async_client, daemon_credential):
         """A daemon for an org with no contacts gets an empty list, not an error."""
         cred, _ = daemon_credential
@@ -214,7 +206,6 @@ class TestCursorPagination:
 class TestOrgScope:
     """A daemon must never see contacts from another org."""
 
-    @pytest.mark.asyncio
     async def test_daemon_cannot_see_other_org_contacts(
         self, async_client, db_session, daemon_credential
     ):
@@ -242,7 +233,6 @@ class TestOrgScope:
             "spy@other.com" not in response2.text for _ in [None]
         )
 
-    @pytest.mark.asyncio
     async def test_requires_daemon_auth(self, async_client, db_session):
         """Endpoint rejects requests without a valid daemon Bearer token."""
         response = await async_client.get("/api/contacts/sync")
@@ -203,7 +203,6 @@ async def _post_chat(client: AsyncClient, headers: dict[str, str], body: dict[st
 # Tests
 # ---------------------------------------------------------------------------
 
-@pytest.mark.asyncio
 async def test_search_signals_scoped_to_org(
     async_client: AsyncClient,
     auth_headers: dict[str, str],
@@ -238,7 +237,6 @@ async def test_search_signals_scoped_to_org(
     assert "0 signals" in tool_results[0]["result_summary"]
 
 
-@pytest.mark.asyncio
 async def test_write_tool_without_confirmed_action_emits_needs_confirm(
     async_client: AsyncClient,
     auth_headers: dict[str, str],
@@ -287,7 +285,6 @@ async def test_write_tool_without_confirmed_action_emits_needs_confirm(
         "send_email must not have executed without confirm"
 
 
-@pytest.mark.asyncio
 async def test_write_tool_with_wrong_confirm_phrase_still_gated(
     async_client: AsyncClient,
     auth_headers: dict[str, str],
@@ -333,7 +330,6 @@ async def test_write_tool_with_wrong_confirm_phrase_still_gated(
     )
 
 
-@pytest.mark.asyncio
 async def test_write_tool_with_correct_confirm_executes(
     async_client: AsyncClient,
     auth_headers: dict[str, str],
@@ -382,7 +378,6 @@ async def test_write_tool_with_correct_confirm_executes(
     assert "new score 52" in update_results[0]["result_summary"]
 
 
-@pytest.mark.asyncio
 async def test_factual_claim_without_citations_triggers_reprompt(
     async_client: AsyncClient,
     auth_headers: dict[str, str],
@@ -416,7 +411,6 @@ async def test_factual_claim_without_citations_triggers_reprompt(
     assert "I don't have evidence" in final_assistant[-1]["text"]
 
 
-@pytest.mark.asyncio
 async def test_telemetry_row_recorded(
     async_client: AsyncClient,
     auth_headers: dict[str, str],
@@ -450,7 +444,6 @@ async def test_telemetry_row_recorded(
     assert row.model.startswith("claude-haiku")
 
 
-@pytest.mark.asyncio
 async def test_thread_history_persisted_and_replayed(
     async_client: AsyncClient,
     auth_headers: dict[str, str],
@@ -500,7 +493,6 @@ async def test_thread_history_persisted_and_replayed(
     assert sent_messages[2]["content"] == "What did I just ask?"
 
 
-@pytest.mark.asyncio
 async def test_exec_send_email_calls_agent_service(
     db_session: AsyncSession,
     seeded_org: Any,
@@ -548,7 +540,6 @@ async def test_exec_send_email_calls_agent_service(
     assert "X-Internal-Api-Key" in captured["headers"]
 
 
-@pytest.mark.asyncio
 async def test_exec_send_email_unknown_contact_errors(
     db_session: AsyncSession,
     seeded_org: Any,
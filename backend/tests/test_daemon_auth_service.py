@@ -12,7 +12,6 @@ import asyncio
 from datetime import datetime, timedelta
 from unittest.mock import patch
 
-import pytest
 import pytest_asyncio
 from fastapi import status
 
@@ -148,7 +147,6 @@ class TestRotateRefreshToken:
         self.refresh_token = refresh
         self.db = db_session
 
-    @pytest.mark.asyncio
     async def test_happy_path_rotation(self):
         """Presenting the current refresh token returns a new one and new access."""
         result = await rotate_refresh_token(self.db, self.refresh_token)
@@ -158,7 +156,6 @@ class TestRotateRefreshToken:
         assert len(new_refresh) > 8
         assert len(access) > 8
 
-    @pytest.mark.asyncio
     async def test_generation_increments(self):
         """Generation counter must increase on each rotation."""
         result = await rotate_refresh_token(self.db, self.refresh_token)
@@ -166,7 +163,6 @@ class TestRotateRefreshToken:
         cred, _, _ = result
         assert cred.refresh_generation == 2  # started at 1 (issue_initial sets 1)
 
-    @pytest.mark.asyncio
     async def test_stale_token_rejected(self):
         """Presenting the original token a second time (already rotated) fails."""
         await rotate_refresh_token(self.db, self.refresh_token)
@@ -180,7 +176,6 @@ class TestRotateRefreshToken:
             # Grace branch — new_r must be sentinel "" (keep current).
             assert new_r == ""
 
-    @pytest.mark.asyncio
     async def test_rotated_token_can_be_used_for_next_rotation(self):
         """After one rotation, the new token is accepted for the next rotation."""
         res1 = await rotate_refresh_token(self.db, self.refresh_token)
@@ -192,7 +187,6 @@ class TestRotateRefreshToken:
         _, new_refresh_2, _ = res2
         assert new_refresh_2 != new_refresh_1
 
-    @pytest.mark.asyncio
     async def test_revoked_credential_rejected(self):
         """Presenting a valid refresh token for a revoked credential returns None."""
         # Manually revoke
@@ -207,7 +201,6 @@ class TestRotateRefreshToken:
         result = await rotate_refresh_token(self.db, self.refresh_token)
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_concurrent_rotation_race_grace(self):
         """Two concurrent calls with the same refresh token.
 
@@ -242,7 +235,6 @@ class TestRotateRefreshToken:
 class TestIssueInitialCredential:
     """Smoke test the first-ever credential issuance."""
 
-    @pytest.mark.asyncio
     async def test_returns_refresh_and_access(self, db_session):
         refresh, access = await issue_initial_credential(
             db=db_session,
@@ -255,7 +247,6 @@ class TestIssueInitialCredential:
         assert isinstance(refresh, str) and len(refresh) > 8
         assert isinstance(access, str) and len(access) > 8
 
-    @pytest.mark.asyncio
     async def test_credential_stored_in_db(self, db_session):
         from sqlalchemy import select
         from app.models import DaemonCredential
@@ -275,7 +266,6 @@ class TestIssueInitialCredential:
         assert cred.organization_id == "org-y"
         assert cred.refresh_generation == 1
 
-    @pytest.mark.asyncio
     async def test_refresh_token_stored_as_hash_not_plaintext(self, db_session):
         from sqlalchemy import select
         from app.models import DaemonCredential
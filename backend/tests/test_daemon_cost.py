@@ -15,7 +15,6 @@ import os
 from datetime import date, datetime
 from uuid import uuid4
 
-import pytest
 import pytest_asyncio
 from fastapi import status
 from sqlalchemy import select
@@ -94,7 +93,6 @@ class TestDaemonCostIncrement:
         # 300+100 + 200+100 = 700 total
         assert r2.json()["haiku_tokens_today"] == 700
 
-    @pytest.mark.asyncio
     async def test_db_row_created_after_increment(
         self, async_client, db_session, daemon_credential
     ):
@@ -239,7 +237,6 @@ class TestTwoDaemonsSameUser:
         assert r1.json()["haiku_tokens_today"] == 100
         assert r2.json()["haiku_tokens_today"] == 300
 
-    @pytest.mark.asyncio
     async def test_two_daemons_each_have_their_own_db_row(
         self, async_client, db_session, two_daemon_creds
     ):
@@ -6,7 +6,6 @@ from datetime import datetime
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
-import pytest
 from sqlalchemy import select
 
 from app.models.deal import Deal
@@ -62,7 +61,6 @@ class TestPipelineStageValidation:
         ]
 
 
-@pytest.mark.asyncio
 class TestDealStatusAgent:
     async def test_creates_suggestion(self, db_session):
         deal = await make_leasing_deal(db_session)
@@ -7,7 +7,6 @@ build_user_digest, plus the simple render path.
 from datetime import datetime, timedelta
 from uuid import uuid4
 
-import pytest
 import pytest_asyncio
 
 from app.models import (
@@ -44,14 +43,12 @@ async def seeded_user(db_session) -> User:
 class TestBuildUserDigestModeBranch:
     """The decision the test plan calls out specifically: cold_start vs steady."""
 
-    @pytest.mark.asyncio
     async def test_no_daemon_yet_returns_cold_start_mode(self, db_session, seeded_user):
         # No DaemonCredential rows at all → cold_start.
         payload = await build_user_digest(str(seeded_user.user_id), db_session)
         assert payload["mode"] == "cold_start"
         assert "cold_start" in payload["items"]
 
-    @pytest.mark.asyncio
     async def test_recent_daemon_returns_cold_start_mode(self, db_session, seeded_user):
         # Daemon registered today → still in the 14-day cold-start window.
         cred = DaemonCredential(
@@ -70,7 +67,6 @@ class TestBuildUserDigestModeBranch:
         payload = await build_user_digest(str(seeded_user.user_id), db_session)
         assert payload["mode"] == "cold_start"
 
-    @pytest.mark.asyncio
     async def test_old_daemon_returns_steady_mode(self, db_session, seeded_user):
         # Daemon registered 30 days ago → past the 14-day cold-start window.
         cred = DaemonCredential(
@@ -93,7 +89,6 @@ class TestBuildUserDigestModeBranch:
         assert "hot" in payload["items"]
         assert "cold_start" not in payload["items"]
 
-    @pytest.mark.asyncio
     async def test_cold_start_pulls_unmatched_samples(self, db_session, seeded_user):
         # Seed 2 unmatched samples for this org; cold_start should surface them.
         org_id = str(seeded_user.organization_id)
@@ -119,7 +114,6 @@ class TestBuildUserDigestModeBranch:
         items = payload["items"]["cold_start"]
         assert len(items) == 2
 
-    @pytest.mark.asyncio
     async def test_steady_renders_without_signals(self, db_session, seeded_user):
         # Old daemon → steady mode; no signals → empty buckets but no crash.
         cred = DaemonCredential(
@@ -4,7 +4,6 @@ Tests for the email triage classifier — mocked Anthropic, no network.
 
 from unittest.mock import AsyncMock, MagicMock
 
-import pytest
 from sqlalchemy import select
 
 from app.models.email_category import DEFAULT_CATEGORIES, EmailCategory, SenderRule
@@ -30,7 +29,6 @@ def mock_llm(category: str):
     return client
 
 
-@pytest.mark.asyncio
 class TestEmailClassifier:
     async def test_seeds_default_categories_on_first_use(self, db_session):
         categories = await ensure_categories(db_session, ORG)
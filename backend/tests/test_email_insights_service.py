@@ -6,8 +6,6 @@ the Mautic-only InsightsService used by GET /insights/daily.
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, patch
 
-import pytest
-
 from app.models.contact import Contact
 from app.models.email_message import EmailMessage
 from app.services.email_insights_service import EmailInsightsService
@@ -53,7 +51,6 @@ async def make_message(
     return msg
 
 
-@pytest.mark.asyncio
 class TestGetHotLeads:
     async def test_empty_org_returns_no_leads(self, db_session):
         service = EmailInsightsService(db_session, ORG)
@@ -120,7 +117,6 @@ class TestGetHotLeads:
         assert leads == []
 
 
-@pytest.mark.asyncio
 class TestGetRecentContacts:
     async def test_most_recent_activity_first(self, db_session):
         older = await make_contact(db_session, first_name="Old", email="old@example.com")
@@ -142,7 +138,6 @@ class TestGetRecentContacts:
         assert recent[1]["id"] == older.id
 
 
-@pytest.mark.asyncio
 class TestGetSummaryStats:
     async def test_counts_reflect_org_data(self, db_session):
         contact = await make_contact(db_session)
@@ -158,7 +153,6 @@ class TestGetSummaryStats:
         assert stats["total_segments"] == 0
 
 
-@pytest.mark.asyncio
 class TestGenerateAiInsights:
     async def test_no_api_key_returns_configure_prompt(self, db_session):
         service = EmailInsightsService(db_session, ORG)
@@ -10,13 +10,15 @@ import uuid
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
 from sqlalchemy import select
 
+from app.models.contact import Contact
+from app.models.email import Email
 from app.models.email_event import TERMINAL_ACTIONS, EmailEvent
 from app.models.email_message import EmailMessage
 from app.models.oauth_connection import ConnectionStatus, OAuthConnection
 from app.services.connectors.gmail import STALE_CURSOR, GmailMessage
+from app.services.inference.email_classifier import Classification
 from app.services.sync.gmail_inbox_sync import GmailInboxSyncService, read_meta
 
 ORG = "org-gmail-test"
@@ -83,7 +85,6 @@ def patch_client(client):
     )
 
 
-@pytest.mark.asyncio
 class TestGmailInboxSync:
     async def test_bootstraps_cursor_on_first_run(self, db_session):
         connection = make_connection(meta="{}")
@@ -240,10 +241,6 @@ class TestGmailInboxSync:
 
     async def test_draft_created_for_draft_enabled_category(self, db_session):
         """Full pipeline: classified To Respond + known contact -> Draft row + terminal event."""
-        from app.models.contact import Contact
-        from app.models.email import Email
-        from app.services.inference.email_classifier import Classification
-
         connection = make_connection()
         connection.connected_user_email = "me@leadspot.test"
         connection.user_id = "user-1"
@@ -6,7 +6,6 @@ from datetime import datetime
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
-import pytest
 from sqlalchemy import select
 
 from app.models.deal import Deal
@@ -41,7 +40,6 @@ async def make_deal(db) -> Deal:
     return deal
 
 
-@pytest.mark.asyncio
 class TestManualIngest:
     async def test_creates_message_and_suggestion(self, db_session):
         deal = await make_deal(db_session)
@@ -0,0 +1,41 @@
+"""
+Tests for OAuth provider authorization URLs.
+
+Tests cover:
+- Query parameter encoding
+- Scope formatting per provider
+"""
+
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from app.services.oauth.gmail import GmailOAuthProvider
+from app.services.oauth.slack import SlackOAuthProvider
+
+REDIRECT_URI = "https://api.example.com/oauth/callback?source=test"
+
+
+class TestAuthorizationUrl:
+    """Tests for get_authorization_url."""
+
+    @pytest.mark.parametrize(
+        "provider_cls,scope_separator",
+        [
+            pytest.param(GmailOAuthProvider, " ", id="gmail"),
+            pytest.param(SlackOAuthProvider, ",", id="slack"),
+        ],
+    )
+    def test_parameters_round_trip(self, provider_cls, scope_separator):
+        """Test every parameter decodes back to its original value."""
+        provider = provider_cls("client-id", "client-secret", REDIRECT_URI)
+        state = "state&with=reserved chars"
+
+        url = provider.get_authorization_url(state)
+        query = parse_qs(urlsplit(url).query, keep_blank_values=True)
+
+        assert url.startswith(provider.authorization_base_url + "?")
+        assert query["client_id"] == ["client-id"]
+        assert query["redirect_uri"] == [REDIRECT_URI]
+        assert query["state"] == [state]
+        assert query["scope"] == [scope_separator.join(provider.scopes)]
@@ -7,7 +7,6 @@ from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
-import pytest
 from sqlalchemy import select
 
 from app.models.contact import Contact
@@ -76,7 +75,6 @@ def mock_graph_pages(*pages_or_errors):
     return patch.object(httpx.AsyncClient, "get", fake_get)
 
 
-@pytest.mark.asyncio
 class TestOutlookSync:
     async def test_syncs_new_messages(self, db_session):
         connection = make_connection()
@@ -5,7 +5,6 @@ Tests for the reply drafter and its guard rails — mocked Anthropic/vector stor
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
 from sqlalchemy import select
 
 from app.models.email_category import SenderRule
@@ -33,7 +32,6 @@ def mock_text_llm(text: str):
     return client
 
 
-@pytest.mark.asyncio
 class TestReplyDrafter:
     async def test_never_draft_rule(self, db_session):
         db_session.add(
@@ -10,7 +10,6 @@ must NOT be touched. A tombstone of type `email_hash` is recorded.
 from datetime import datetime
 from uuid import uuid4
 
-import pytest
 import pytest_asyncio
 from fastapi import status
 from sqlalchemy import select
@@ -79,7 +78,6 @@ async def _seed_signal_for_email(
 class TestUserForgetEndpoint:
     """Regular users may purge data within their own org."""
 
-    @pytest.mark.asyncio
     async def test_forget_purges_only_within_user_org(
         self, async_client, db_session
     ):
@@ -129,7 +127,6 @@ class TestUserForgetEndpoint:
         assert tombstone.tombstone_type == "email_hash"
         assert tombstone.email_hash == compute_email_hash("evil@spam.com")
 
-    @pytest.mark.asyncio
     async def test_forget_requires_authentication(self, async_client):
         response = await async_client.post(
             "/api/contacts/forget",
@@ -137,7 +134,6 @@ class TestUserForgetEndpoint:
         )
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
-    @pytest.mark.asyncio
     async def test_forget_rejects_invalid_email(self, async_client, db_session):
         org_id = str(uuid4())
         user = await _seed_user(db_session, org_id)
@@ -22,7 +22,6 @@ import asyncio
 from datetime import datetime, timedelta
 from uuid import uuid4
 
-import pytest
 import pytest_asyncio
 from fastapi import status
 from sqlalchemy import select
@@ -153,7 +152,6 @@ class TestSignalIdempotency:
 class TestMergeRedirectResolution:
     """Critical: signal targeting a merged contact must land on the merge target."""
 
-    @pytest.mark.asyncio
     async def test_signal_attributed_to_merge_target(self, async_client, db_session, daemon_credential):
         cred, _ = daemon_credential
         org_id = cred.organization_id
@@ -193,7 +191,6 @@ class TestMergeRedirectResolution:
 class TestOrgScopeEnforcement:
     """Signal targeting a contact in a different org must produce an orphan (contact_id=null)."""
 
-    @pytest.mark.asyncio
     async def test_cross_org_contact_produces_orphan(self, async_client, db_session, daemon_credential):
         cred, _ = daemon_credential
         other_org_id = str(uuid4())
@@ -378,7 +375,6 @@ class TestSoftDeleteSignal:
         response = client.delete(f"/api/signals/{signal.id}", headers=headers)
         assert response.status_code == status.HTTP_204_NO_CONTENT
 
-    @pytest.mark.asyncio
     async def test_delete_sets_deleted_at(self, async_client, db_session, test_user, one_signal):
         signal, _ = one_signal
         from uuid import UUID
@@ -396,7 +392,6 @@ class TestSoftDeleteSignal:
         await db_session.refresh(signal)
         assert signal.deleted_at is not None
 
-    @pytest.mark.asyncio
     async def test_delete_inserts_tombstone_of_type_signal(self, async_client, db_session, test_user, one_signal):
         signal, _ = one_signal
         from uuid import UUID
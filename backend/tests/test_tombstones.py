@@ -12,7 +12,6 @@ Covers:
 from datetime import datetime, timedelta
 from uuid import uuid4
 
-import pytest
 import pytest_asyncio
 from fastapi import status
 
@@ -53,7 +52,6 @@ async def _seed_tombstone(db_session, org_id: str, offset_seconds: int = 0) -> S
 class TestTombstonesOrgScope:
     """Daemons can only see tombstones from their own org."""
 
-    @pytest.mark.asyncio
     async def test_returns_only_own_org_tombstones(
         self, async_client, db_session, daemon_credential
     ):
@@ -72,7 +70,6 @@ class TestTombstonesOrgScope:
         # Count must not include the other-org tombstone
         assert len(returned_ids) == 1
 
-    @pytest.mark.asyncio
     async def test_empty_result_for_org_with_no_tombstones(
         self, async_client, daemon_credential
     ):
@@ -105,7 +102,6 @@ class TestTombstonesPagination:
             tombstones.append(t)
         return cred, tombstones
 
-    @pytest.mark.asyncio
     async def test_limit_respected(self, async_client, five_tombstones):
         cred, _ = five_tombstones
         response = await async_client.get(
@@ -114,7 +110,6 @@ class TestTombstonesPagination:
         assert response.status_code == status.HTTP_200_OK
         assert len(response.json()["tombstones"]) == 3
 
-    @pytest.mark.asyncio
     async def test_cursor_returns_next_page(self, async_client, five_tombstones):
         cred, tombstones = five_tombstones
         p1 = await async_client.get(
@@ -138,7 +133,6 @@ class TestTombstonesPagination:
         # Must contain new tombstones
         assert len(ids_p2 - ids_p1) >= 1
 
-    @pytest.mark.asyncio
     async def test_ascending_order_by_issued_at(self, async_client, five_tombstones):
         cred, tombstones = five_tombstones
         response = await async_client.get(
@@ -150,7 +144,6 @@ class TestTombstonesPagination:
         issued_ats = [r["issued_at"] for r in rows]
         assert issued_ats == sorted(issued_ats)
 
-    @pytest.mark.asyncio
     async def test_full_page_has_next_since(self, async_client, five_tombstones):
         cred, _ = five_tombstones
         response = await async_client.get(
@@ -158,7 +151,6 @@ class TestTombstonesPagination:
         )
         assert response.json()["next_since"] is not None
 
-    @pytest.mark.asyncio
     async def test_partial_page_has_no_next_since(self, async_client, five_tombstones):
         cred, _ = five_tombstones
         response = await async_client.get(
@@ -174,7 +166,6 @@ class TestTombstonesPagination:
 class TestTombstoneFields:
     """Verify field values returned in the response."""
 
-    @pytest.mark.asyncio
     async def test_signal_tombstone_has_correct_fields(
         self, async_client, db_session, daemon_credential
     ):
@@ -199,7 +190,6 @@ class TestTombstoneFields:
         assert row["signal_id"] == signal_id
         assert row["id"] == t.id
 
-    @pytest.mark.asyncio
     async def test_email_hash_tombstone_has_correct_fields(
         self, async_client, db_session, daemon_credential
     ):
@@ -0,0 +1,85 @@
+"""
+Tests for app/services/wallet_service.py.
+
+Covers:
+- Rebilled operation on an empty client wallet with auto-recharge.
+- Client auto-recharge is kept when the agency debit fails.
+"""
+
+from decimal import Decimal
+from uuid import uuid4
+
+from app.models.organization import Organization
+from app.services.wallet_service import RebillingService, WalletService
+
+
+def _org(**overrides) -> Organization:
+    org_id = str(uuid4())
+    return Organization(
+        organization_id=org_id,
+        name=overrides.pop("name", "Org"),
+        domain=f"{org_id}.example.com",
+        **overrides,
+    )
+
+
+def _agency_and_client(agency_balance: Decimal) -> tuple[Organization, Organization]:
+    """An agency with 2x rebilling and an empty client wallet on auto-recharge."""
+    agency = _org(
+        name="Agency",
+        organization_type="agency",
+        wallet_balance=agency_balance,
+        features={"rebilling_enabled": True, "rebilling_markup": 2.0},
+    )
+    client = _org(
+        name="Client",
+        parent_organization_id=agency.organization_id,
+        wallet_balance=Decimal("0.00"),
+        wallet_auto_recharge=True,
+        wallet_recharge_amount=Decimal("50.00"),
+        stripe_customer_id="cus_test",
+    )
+    return agency, client
+
+
+class TestRebilledOperation:
+    """RebillingService.process_rebilled_operation."""
+
+    async def test_auto_recharges_empty_client_wallet(self, db_session):
+        agency, client = _agency_and_client(Decimal("100.00"))
+        db_session.add_all([agency, client])
+        await db_session.commit()
+
+        wallet_service = WalletService(db_session)
+        rebilling = RebillingService(db_session, wallet_service)
+        # Match app.database.async_session_maker, which does not autoflush
+        with db_session.no_autoflush:
+            result = await rebilling.process_rebilled_operation(
+                client.organization_id, "chat_message"
+            )
+
+        assert result["success"] is True
+        assert result["client_cost"] == Decimal("0.02")
+        await db_session.refresh(client)
+        await db_session.refresh(agency)
+        assert client.wallet_balance == Decimal("49.98")
+        assert agency.wallet_balance == Decimal("99.99")
+
+    async def test_client_recharge_survives_failed_agency_debit(self, db_session):
+        agency, client = _agency_and_client(Decimal("0.00"))
+        db_session.add_all([agency, client])
+        await db_session.commit()
+
+        wallet_service = WalletService(db_session)
+        rebilling = RebillingService(db_session, wallet_service)
+        with db_session.no_autoflush:
+            result = await rebilling.process_rebilled_operation(
+                client.organization_id, "chat_message"
+            )
+
+        assert result["success"] is False
+        await db_session.refresh(client)
+        await db_session.refresh(agency)
+        # The recharge was charged, so it stays; the client debit does not
+        assert client.wallet_balance == Decimal("50.00")
+        assert agency.wallet_balance == Decimal("0.00")
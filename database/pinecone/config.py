@@ -2,42 +2,51 @@
 Pinecone Vector Database Configuration for InnoSynth.ai
 """
 
-PINECONE_CONFIG = {
-    "index_name": "innosynth-documents",
-    "dimension": 1536,  # OpenAI text-embedding-3-small output dimension
-    "metric": "cosine",
-    "spec": {
-        "serverless": {
-            "cloud": "aws",
-            "region": "us-east-1"
-        }
-    },
-    "metadata_config": {
-        "indexed": [
-            "organization_id",
-            "source_system",
-            "author",
-            "created_at"
-        ]
-    }
-}
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TypedDict
+
+
+@dataclass(frozen=True, slots=True)
+class PineconeConfig:
+    """Index settings (read-only)"""
+    index_name: str = "innosynth-documents"
+    dimension: int = 1536  # OpenAI text-embedding-3-small output dimension
+    metric: str = "cosine"
+    # Serverless spec
+    cloud: str = "aws"
+    region: str = "us-east-1"
+    # Metadata fields to index
+    indexed_metadata: tuple[str, ...] = (
+        "organization_id",
+        "source_system",
+        "author",
+        "created_at"
+    )
+
+
+PINECONE_CONFIG = PineconeConfig()
 
 # Metadata schema for vectors
-VECTOR_METADATA_SCHEMA = {
-    "document_id": str,           # UUID from PostgreSQL
-    "organization_id": str,       # Organization UUID
-    "source_system": str,         # 'sharepoint', 'gdrive', 'slack'
-    "title": str,                 # Document title
-    "author": str,                # Author name/email
-    "created_at": str,            # ISO timestamp
-    "url": str,                   # Link to source
-    "chunk_index": int,           # Position in document
-    "chunk_total": int            # Total chunks in document
-}
+class VectorMetadata(TypedDict):
+    """Metadata stored with each vector"""
+    document_id: str              # UUID from PostgreSQL
+    organization_id: str          # Organization UUID
+    source_system: str            # 'sharepoint', 'gdrive', 'slack'
+    title: str                    # Document title
+    author: str                   # Author name/email
+    created_at: str               # ISO timestamp
+    url: str                      # Link to source
+    chunk_index: int              # Position in document
+    chunk_total: int              # Total chunks in document
+
+
+# Field name -> type map of VectorMetadata (kept for existing callers)
+VECTOR_METADATA_SCHEMA = MappingProxyType(VectorMetadata.__annotations__)
 
 # Search configuration
-SEARCH_CONFIG = {
+SEARCH_CONFIG = MappingProxyType({
     "top_k": 20,                  # Number of results to return
     "include_metadata": True,
     "include_values": False       # We don't need the vectors back
-}
+})
@@ -3,29 +3,40 @@ Script to initialize Pinecone index for InnoSynth.ai
 """
 import os
 from pinecone import Pinecone, ServerlessSpec
+from pinecone.exceptions import NotFoundException
 from config import PINECONE_CONFIG
 
+_pinecone_client: Pinecone | None = None
+
+
+def get_pinecone_client() -> Pinecone:
+    """Get or create the Pinecone client (reused across calls)."""
+    global _pinecone_client
+    if _pinecone_client is None:
+        _pinecone_client = Pinecone(api_key=os.environ.get("PINECONE_API_KEY"))
+    return _pinecone_client
+
+
 def create_index():
     """Create the Pinecone index if it doesn't exist."""
-    pc = Pinecone(api_key=os.environ.get("PINECONE_API_KEY"))
-
-    # Check if index already exists
-    existing_indexes = pc.list_indexes().names()
+    pc = get_pinecone_client()
 
-    if PINECONE_CONFIG["index_name"] not in existing_indexes:
-        print(f"Creating index: {PINECONE_CONFIG['index_name']}")
+    # Check if index already exists (one lookup instead of listing all indexes)
+    try:
+        pc.describe_index(PINECONE_CONFIG.index_name)
+        print(f"Index {PINECONE_CONFIG.index_name} already exists.")
+    except NotFoundException:
+        print(f"Creating index: {PINECONE_CONFIG.index_name}")
         pc.create_index(
-            name=PINECONE_CONFIG["index_name"],
-            dimension=PINECONE_CONFIG["dimension"],
-            metric=PINECONE_CONFIG["metric"],
-            spec=ServerlessSpec(**PINECONE_CONFIG["spec"]["serverless"])
+            name=PINECONE_CONFIG.index_name,
+            dimension=PINECONE_CONFIG.dimension,
+            metric=PINECONE_CONFIG.metric,
+            spec=ServerlessSpec(cloud=PINECONE_CONFIG.cloud, region=PINECONE_CONFIG.region)
         )
         print("Index created successfully!")
-    else:
-        print(f"Index {PINECONE_CONFIG['index_name']} already exists.")
 
     # Get index info
-    index = pc.Index(PINECONE_CONFIG["index_name"])
+    index = pc.Index(PINECONE_CONFIG.index_name)
     stats = index.describe_index_stats()
     print(f"Index stats: {stats}")
 